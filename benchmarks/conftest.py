@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+# wevo_api.py only depends on aiohttp, so it is imported directly to keep the
+# benchmarks independent of a Home Assistant install.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components" / "wevo_energy"))
+
+from probes import Runner  # noqa: E402
+
+
+@pytest.fixture
+def run() -> Iterator[Runner]:
+    runner = Runner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture
+def mock_wevo(run: Runner) -> Iterator[Callable[..., Any]]:
+    """Start a mock Wevo server and return a factory for API clients bound to it."""
+    from aiohttp import ClientSession
+    from aiohttp.test_utils import TestServer
+
+    from mock_server import BASE_PATH, COGNITO_PATH, MockConfig, MockWevoServer
+    from wevo_api import WevoApiClient
+
+    class MockWevoApiClient(WevoApiClient):
+        def __init__(self, session: ClientSession, root: str) -> None:
+            super().__init__(session, f"{root}{BASE_PATH}", "mock-region", "mock-client")
+            self._mock_cognito_url = f"{root}{COGNITO_PATH}"
+
+        @property
+        def cognito_url(self) -> str:
+            return self._mock_cognito_url
+
+    started: list[tuple[TestServer, ClientSession, list[WevoApiClient]]] = []
+
+    async def _start(mock: MockWevoServer) -> tuple[TestServer, ClientSession]:
+        server = TestServer(mock.app)
+        await server.start_server()
+        return server, ClientSession()
+
+    def factory(**config: Any) -> tuple[MockWevoServer, Callable[[], WevoApiClient]]:
+        mock = MockWevoServer(MockConfig(**config))
+        server, session = run(_start(mock))
+        clients: list[WevoApiClient] = []
+        root = str(server.make_url("")).rstrip("/")
+        started.append((server, session, clients))
+
+        def new_client() -> WevoApiClient:
+            client = MockWevoApiClient(session, root)
+            clients.append(client)
+            return client
+
+        return mock, new_client
+
+    yield factory
+
+    for server, session, clients in started:
+        for client in clients:
+            run(client.close())
+        run(session.close())
+        run(server.close())
+
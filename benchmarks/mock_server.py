@@ -0,0 +1,175 @@
+"""Local stand-in for the Wevo mobile API and Cognito InitiateAuth.
+
+Only the surface the integration talks to is implemented. Latency, HTTP
+errors and dropped websocket frames can be injected through ``MockConfig``
+so transport changes can be measured under realistic and degraded conditions.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+BASE_PATH = "/mobileapp"
+COGNITO_PATH = "/cognito/"
+MOCK_PASSWORD = "password"
+
+
+@dataclass
+class MockConfig:
+    latency: float = 0.0
+    error_rate: float = 0.0
+    drop_rate: float = 0.0
+    transactions: int = 50
+    chargers: int = 1
+    push_interval: float | None = None
+    seed: int = 1234
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+def charger_id(index: int) -> str:
+    return f"WEVO{index:05d}"
+
+
+def make_transactions(count: int, chargers: int) -> list[dict[str, Any]]:
+    now = int(time.time())
+    return [
+        {
+            "transactionId": count - i,
+            "chargerIdentifier": charger_id(i % max(chargers, 1)),
+            "startTime": now - (i + 1) * 7200,
+            "endTime": now - (i + 1) * 7200 + 3600,
+            "avgRateKW": 7.2,
+            "totalEnergyKwh": round(5 + (i % 30) * 0.5, 3),
+        }
+        for i in range(count)
+    ]
+
+
+def state_frame(charger: str, connector: Any, state: str = "Charging") -> dict[str, Any]:
+    return {
+        "chargerIdentifier": charger,
+        "connector": connector,
+        "state": state,
+        "transactionData": {"rateKw": 7.1, "totalEnergyKwh": 3.25},
+    }
+
+
+class MockWevoServer:
+    def __init__(self, config: MockConfig | None = None) -> None:
+        self.config = config or MockConfig()
+        self._random = random.Random(self.config.seed)
+        self._transactions: list[dict[str, Any]] = []
+        self._body = b"[]"
+        self._etag = ""
+        self.set_transactions(self.config.transactions)
+
+        self.app = web.Application()
+        self.app.router.add_get(f"{BASE_PATH}/rest/user/details", self._user_details)
+        self.app.router.add_get(f"{BASE_PATH}/rest/transactions", self._transactions_handler)
+        self.app.router.add_get(f"{BASE_PATH}/ws", self._websocket)
+        self.app.router.add_post(COGNITO_PATH, self._cognito)
+
+    def set_transactions(self, count: int) -> None:
+        self._transactions = make_transactions(count, self.config.chargers)
+        self._body = json.dumps(self._transactions).encode()
+        self._etag = '"' + hashlib.sha1(self._body).hexdigest() + '"'
+
+    def _count(self, name: str) -> None:
+        self.config.counters[name] = self.config.counters.get(name, 0) + 1
+
+    async def _delay(self) -> None:
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+    def _fail(self) -> bool:
+        return self._random.random() < self.config.error_rate
+
+    def _authorized(self, request: web.Request) -> bool:
+        return request.headers.get("Authorization", "").startswith("Bearer ")
+
+    async def _user_details(self, request: web.Request) -> web.Response:
+        self._count("details")
+        await self._delay()
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if self._fail():
+            return web.Response(status=500, text="injected error")
+        return web.json_response({"userId": 42, "chargerIdentifier": charger_id(0)})
+
+    async def _transactions_handler(self, request: web.Request) -> web.Response:
+        self._count("transactions")
+        await self._delay()
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if self._fail():
+            return web.Response(status=500, text="injected error")
+        if request.headers.get("If-None-Match") == self._etag:
+            return web.Response(status=304)
+        return web.Response(body=self._body, content_type="application/json", headers={"ETag": self._etag})
+
+    async def _cognito(self, request: web.Request) -> web.Response:
+        self._count("cognito")
+        await self._delay()
+        payload = json.loads(await request.text())
+        params = payload.get("AuthParameters", {})
+        if self._fail():
+            return web.json_response({"__type": "InternalErrorException", "message": "injected"}, status=500)
+        if payload.get("AuthFlow") == "USER_PASSWORD_AUTH" and params.get("PASSWORD") != MOCK_PASSWORD:
+            return web.json_response({"__type": "NotAuthorizedException", "message": "Incorrect password"}, status=400)
+        result = {"AccessToken": f"access-{time.monotonic_ns()}", "ExpiresIn": 3600}
+        if payload.get("AuthFlow") == "USER_PASSWORD_AUTH":
+            result["RefreshToken"] = "refresh-token"
+        return web.json_response({"AuthenticationResult": result})
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        self._count("ws_connect")
+        if not self._authorized(request):
+            raise web.HTTPUnauthorized()
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        pusher = None
+        if self.config.push_interval:
+            pusher = asyncio.create_task(self._push(ws))
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                self._count("ws_command")
+                command = json.loads(msg.data)
+                asyncio.create_task(self._answer(ws, command))
+        finally:
+            if pusher is not None:
+                pusher.cancel()
+        return ws
+
+    async def _answer(self, ws: web.WebSocketResponse, command: dict[str, Any]) -> None:
+        await self._delay()
+        if ws.closed or self._random.random() < self.config.drop_rate:
+            return
+        charger = command.get("chargerIdentifier")
+        connector = command.get("connector")
+        if command.get("command") == "authorize":
+            await ws.send_json(
+                {"command": "authorize", "chargerIdentifier": charger, "connector": connector, "status": "Accepted"}
+            )
+            await ws.send_json(state_frame(charger, connector, "Preparing"))
+        else:
+            await ws.send_json(state_frame(charger, connector))
+
+    async def _push(self, ws: web.WebSocketResponse) -> None:
+        while not ws.closed:
+            await asyncio.sleep(self.config.push_interval)
+            for index in range(self.config.chargers):
+                if self._random.random() < self.config.drop_rate:
+                    continue
+                try:
+                    await ws.send_json(state_frame(charger_id(index), 1))
+                except ConnectionResetError:
+                    return
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Runner:
+    """Drives coroutines on a private event loop from synchronous benchmark bodies."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def __call__(self, coro: Awaitable[_T]) -> _T:
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+
+def measure_loop_lag(run: Runner, coro_factory: Callable[[], Awaitable[Any]], tick: float = 0.001) -> float:
+    """Run a coroutine and return the longest event-loop stall seen by a ticker, in ms."""
+
+    async def _measure() -> float:
+        worst = 0.0
+        done = asyncio.Event()
+
+        async def _ticker() -> None:
+            nonlocal worst
+            loop = asyncio.get_running_loop()
+            while not done.is_set():
+                start = loop.time()
+                await asyncio.sleep(tick)
+                worst = max(worst, loop.time() - start - tick)
+
+        ticker = asyncio.create_task(_ticker())
+        try:
+            await coro_factory()
+        finally:
+            done.set()
+            await ticker
+        return worst * 1000
+
+    return run(_measure())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("pytest_benchmark")
+
+from mock_server import MOCK_PASSWORD, charger_id  # noqa: E402
+from probes import measure_loop_lag  # noqa: E402
+
+TOKEN = "bench-token"
+
+
+def test_login_latency(benchmark, run, mock_wevo):
+    _, new_client = mock_wevo()
+    client = new_client()
+
+    tokens = benchmark(lambda: run(client.login("bench@example.com", MOCK_PASSWORD)))
+
+    assert tokens.access_token
+
+
+def test_get_state_latency(benchmark, run, mock_wevo):
+    mock, new_client = mock_wevo()
+    client = new_client()
+    run(client.get_state(TOKEN, charger_id(0), "1"))
+
+    state = benchmark(lambda: run(client.get_state(TOKEN, charger_id(0), "1")))
+
+    assert state["chargerIdentifier"] == charger_id(0)
+    # The socket is persistent, every measured call reuses the first handshake.
+    assert mock.config.counters["ws_connect"] == 1
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.05])
+def test_authorize_latency(benchmark, run, mock_wevo, latency):
+    _, new_client = mock_wevo(latency=latency)
+    client = new_client()
+
+    frame = benchmark(lambda: run(client.authorize(TOKEN, charger_id(0), "1")))
+
+    # Completion is driven by the acknowledgement, not a fixed receive loop.
+    assert frame is not None
+
+
+@pytest.mark.parametrize("history", [10, 1000, 10000])
+def test_get_transactions_latency(benchmark, run, mock_wevo, history):
+    _, new_client = mock_wevo(transactions=history)
+    client = new_client()
+
+    transactions = benchmark(lambda: run(client.get_transactions(TOKEN)))
+
+    assert len(transactions) == history
+
+
+@pytest.mark.parametrize("history", [1000, 10000])
+def test_get_transactions_window_latency(benchmark, run, mock_wevo, history):
+    _, new_client = mock_wevo(transactions=history)
+    client = new_client()
+
+    transactions = benchmark(lambda: run(client.get_transactions(TOKEN, limit=20)))
+
+    # Only the requested window is decoded, however long the history is.
+    assert len(transactions) == 20
+    assert transactions[0]["transactionId"] == history
+
+
+@pytest.mark.parametrize("chargers", [1, 10, 100])
+def test_fleet_refresh_throughput(benchmark, run, mock_wevo, chargers):
+    """One refresh cycle of N charger coordinators sharing an account transport."""
+    mock, new_client = mock_wevo(chargers=chargers, latency=0.005)
+    client = new_client()
+
+    async def _refresh_all() -> list:
+        return await asyncio.gather(
+            client.get_transactions(TOKEN),
+            *(client.get_state(TOKEN, charger_id(i), "1") for i in range(chargers)),
+        )
+
+    results = benchmark(lambda: run(_refresh_all()))
+
+    assert len(results) == chargers + 1
+    if benchmark.stats is not None:
+        benchmark.extra_info["refreshes_per_second"] = chargers / benchmark.stats.stats.mean
+    benchmark.extra_info["ws_connects"] = mock.config.counters["ws_connect"]
+
+
+@pytest.mark.parametrize("history", [1000, 20000])
+def test_event_loop_blocking(benchmark, run, mock_wevo, history):
+    _, new_client = mock_wevo(transactions=history)
+    client = new_client()
+    lags: list[float] = []
+
+    def _fetch() -> None:
+        lags.append(measure_loop_lag(run, lambda: client.get_transactions(TOKEN)))
+
+    benchmark.pedantic(_fetch, rounds=5, iterations=1)
+
+    benchmark.extra_info["max_loop_lag_ms"] = max(lags)
+
+
+@pytest.mark.parametrize("entries", [1, 10, 100])
+def test_memory_per_entry(benchmark, run, mock_wevo, entries):
+    _, new_client = mock_wevo(chargers=entries)
+
+    async def _poll_all(clients: list) -> list:
+        return await asyncio.gather(*(client.get_state(TOKEN, charger_id(i), "1") for i, client in enumerate(clients)))
+
+    def _measure() -> int:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        clients = [new_client() for _ in range(entries)]
+        states = run(_poll_all(clients))
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        assert len(states) == entries
+        return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    allocated = benchmark.pedantic(_measure, rounds=1, iterations=1)
+
+    benchmark.extra_info["bytes_per_entry"] = allocated / entries
+
+
+@pytest.mark.parametrize("connectors", [1, 2, 4])
+def test_batched_connector_states(benchmark, run, mock_wevo, connectors):
+    _, new_client = mock_wevo(latency=0.005)
+    client = new_client()
+    wanted = [str(connector) for connector in range(1, connectors + 1)]
+
+    states = benchmark(lambda: run(client.get_states(TOKEN, charger_id(0), wanted)))
+
+    assert sorted(states) == wanted
+    assert all(state["connector"] == connector for connector, state in states.items())
@@ -1,30 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema("wevo_energy")
 
-from .const import DOMAIN, PLATFORMS
+from .account import async_get_account, async_release_account
+from .const import (
+    CONF_CONNECTOR,
+    CONF_CONNECTORS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PUSH_MODE,
+    CONF_TARGET_ENERGY,
+    DATA_FLEET,
+    DATA_SNAPSHOT_STORE,
+    DATA_TOKEN_STORE,
+    DOMAIN,
+    PLATFORMS,
+)
 from .coordinator import WevoCoordinator
+from .fleet import WevoFleetScheduler
+from .services import async_setup_services
+from .storage import WevoSnapshotStore, WevoTokenStore
+
+# Entry data the options flow can change; tokens are written to the same data and must not reload.
+_OPTION_KEYS = (
+    CONF_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_CONNECTOR,
+    CONF_CONNECTORS,
+    CONF_PUSH_MODE,
+    CONF_TARGET_ENERGY,
+)
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    token_store = WevoTokenStore(hass)
+    snapshot_store = WevoSnapshotStore(hass)
+    await asyncio.gather(token_store.async_load(), snapshot_store.async_load())
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[DATA_TOKEN_STORE] = token_store
+    domain_data[DATA_SNAPSHOT_STORE] = snapshot_store
+    domain_data[DATA_FLEET] = WevoFleetScheduler()
+    async_setup_services(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = WevoCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    account = async_get_account(hass, entry)
+    coordinator = WevoCoordinator(hass, entry, account)
+    try:
+        await coordinator.ledger.async_load()
+        restored = coordinator.async_restore_snapshot()
+        if not restored:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_shutdown()
+        await async_release_account(hass, account, entry)
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if restored:
+        # Entities already show the last known state; the cloud is not allowed to hold up startup.
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN}_first_refresh")
+    coordinator.async_start_listening()
+
+    options = {key: entry.data.get(key) for key in _OPTION_KEYS}
+
+    async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        if {key: entry.data.get(key) for key in _OPTION_KEYS} != options:
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
+            await async_release_account(hass, coordinator.account, entry)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    hass.data[DOMAIN][DATA_SNAPSHOT_STORE].async_remove(entry.entry_id)
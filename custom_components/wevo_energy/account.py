@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_BASE_URL,
+    CONF_COGNITO_CLIENT_ID,
+    CONF_COGNITO_REGION,
+    CONF_COGNITO_USERNAME,
+    CONF_EXPIRES_AT,
+    CONF_REFRESH_TOKEN,
+    DATA_ACCOUNTS,
+    DATA_DISCOVERY,
+    DATA_TOKEN_STORE,
+    DISCOVERY_CACHE_TTL,
+    DOMAIN,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    TOKEN_REFRESH_RETRY_SECONDS,
+)
+from .storage import WevoTokenStore
+from .wevo_api import WevoApiClient, WevoApiError, WevoAuthError, WevoTokenRejectedError, WevoTokens, jittered
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def account_key(data: dict[str, Any]) -> str:
+    return f"{data[CONF_BASE_URL].rstrip('/')}|{data.get(CONF_COGNITO_USERNAME, '')}"
+
+
+@dataclass
+class WevoDiscovery:
+    """Chargers and history found while onboarding an account."""
+
+    chargers: list[str]
+    driver_id: int | None
+    transactions: list[dict[str, Any]]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self.fetched_at < DISCOVERY_CACHE_TTL
+
+
+def cached_discovery(hass: HomeAssistant, key: str) -> WevoDiscovery | None:
+    cache: dict[str, WevoDiscovery] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_DISCOVERY, {})
+    for stale in [k for k, discovery in cache.items() if not discovery.fresh]:
+        del cache[stale]
+    return cache.get(key)
+
+
+async def async_discover(hass: HomeAssistant, api: WevoApiClient, key: str, access_token: str) -> WevoDiscovery:
+    if (discovery := cached_discovery(hass, key)) is not None:
+        return discovery
+    details, transactions = await asyncio.gather(
+        api.get_user_details(access_token),
+        api.get_transactions(access_token),
+    )
+    chargers = {str(tx["chargerIdentifier"]) for tx in transactions if tx.get("chargerIdentifier")}
+    if details.get("chargerIdentifier"):
+        chargers.add(str(details["chargerIdentifier"]))
+    discovery = WevoDiscovery(sorted(chargers), details.get("userId"), transactions)
+    cache = hass.data[DOMAIN][DATA_DISCOVERY]
+    cache[key] = discovery
+
+    @callback
+    def _expire(_now: datetime) -> None:
+        # Nothing may look the entry up again, and it holds the account's whole history.
+        if cache.get(key) is discovery:
+            del cache[key]
+
+    async_call_later(hass, DISCOVERY_CACHE_TTL, _expire)
+    return discovery
+
+
+class WevoAccount:
+    """Token state and transport shared by every config entry of one Wevo account."""
+
+    def __init__(self, hass: HomeAssistant, key: str, data: dict[str, Any], token_store: WevoTokenStore) -> None:
+        self.hass = hass
+        self.key = key
+        self.entry_ids: set[str] = set()
+
+        self._token_store = token_store
+        self._access_token, self._expires_at = token_store.get(key)
+        self._refresh_token = data.get(CONF_REFRESH_TOKEN)
+        self._cognito_username = data.get(CONF_COGNITO_USERNAME, "")
+
+        self.api = WevoApiClient(
+            session=async_get_clientsession(hass),
+            base_url=data[CONF_BASE_URL],
+            cognito_region=data[CONF_COGNITO_REGION],
+            cognito_client_id=data[CONF_COGNITO_CLIENT_ID],
+        )
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+    @property
+    def access_token(self) -> str:
+        return self._access_token
+
+    @callback
+    def async_start(self) -> None:
+        self._schedule_token_refresh()
+
+    async def async_ensure_fresh_token(self) -> None:
+        if self._refresh_token is None:
+            return
+        now = time.time()
+        if self._access_token and (self._expires_at <= 0 or now < self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS):
+            return
+        if self._access_token and now < self._expires_at:
+            # Still usable: renew in the background instead of stalling the caller, unless a renewal
+            # is already running or a timer (e.g. a retry after a failed attempt) is pending.
+            if self._unsub_refresh is None and not self._refresh_lock.locked():
+                self._schedule_token_refresh(0)
+            return
+
+        try:
+            await self._async_refresh_token()
+        except WevoAuthError:
+            self._async_start_reauth()
+            raise
+
+    @callback
+    def async_set_tokens(self, tokens: WevoTokens) -> None:
+        self._access_token = tokens.access_token
+        self._expires_at = tokens.expires_at
+        self._token_store.async_set(self.key, self._access_token, self._expires_at)
+
+        # Only the long-lived refresh token belongs in the config entries.
+        if tokens.refresh_token and tokens.refresh_token != self._refresh_token:
+            self._refresh_token = tokens.refresh_token
+            for entry in self._entries():
+                new_data = {**entry.data, CONF_REFRESH_TOKEN: self._refresh_token}
+                self.hass.config_entries.async_update_entry(entry, data=new_data)
+        self._schedule_token_refresh()
+
+    async def _async_refresh_token(self, rejected: str | None = None) -> None:
+        async with self._refresh_lock:
+            # Another caller may have finished a refresh while this one waited.
+            if rejected is not None:
+                if self._access_token != rejected:
+                    return
+            elif self._access_token and time.time() < self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+                return
+            tokens = await self.api.refresh_access_token(self._refresh_token, self._cognito_username)
+            self.async_set_tokens(tokens)
+
+    @callback
+    def _schedule_token_refresh(self, delay: float | None = None) -> None:
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        if self._refresh_token is None or self._expires_at <= 0:
+            return
+        if delay is None:
+            delay = max(0, self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS - time.time())
+        self._unsub_refresh = async_call_later(self.hass, delay, self._handle_refresh_timer)
+
+    @callback
+    def _handle_refresh_timer(self, _now: datetime) -> None:
+        self._unsub_refresh = None
+        self.hass.async_create_background_task(self._async_background_refresh(), f"{DOMAIN}_token_refresh")
+
+    async def _async_background_refresh(self) -> None:
+        try:
+            await self._async_refresh_token()
+        except WevoAuthError as err:
+            _LOGGER.warning("Wevo refresh token rejected, reauthentication required: %s", err)
+            self._async_start_reauth()
+        except WevoApiError as err:
+            _LOGGER.warning("Wevo token refresh failed, retrying: %s", err)
+            self._schedule_token_refresh(max(err.retry_after or 0, jittered(TOKEN_REFRESH_RETRY_SECONDS)))
+
+    @callback
+    def _async_start_reauth(self) -> None:
+        for entry in self._entries():
+            entry.async_start_reauth(self.hass)
+
+    async def async_get_states(self, charger_identifier: str, connectors: list[str]) -> dict[str, dict[str, Any]]:
+        await self.async_ensure_fresh_token()
+        states = await self._coalesce(
+            ("getState", charger_identifier, tuple(connectors)),
+            lambda: self.api.get_states(self._access_token, charger_identifier, connectors),
+        )
+        # Coalesced callers share one reply, hand each its own copies to decorate.
+        return {connector: dict(state) for connector, state in states.items()}
+
+    async def async_get_transactions(
+        self, limit: int | None = None, since: int | None = None, cached: bool = False
+    ) -> list[dict[str, Any]]:
+        discovery = cached_discovery(self.hass, self.key) if cached and limit is None and since is None else None
+        if discovery is not None:
+            # Entries created from one onboarding share the history it already downloaded for their first load.
+            return discovery.transactions
+        await self.async_ensure_fresh_token()
+        return await self._coalesce(
+            ("transactions", limit, since),
+            lambda: self.api.get_transactions(self._access_token, limit=limit, since=since),
+        )
+
+    async def async_authorize(self, charger_identifier: str, connector: str) -> dict[str, Any] | None:
+        await self.async_ensure_fresh_token()
+        return await self._async_with_renewal(
+            lambda: self.api.authorize(self._access_token, charger_identifier, connector)
+        )
+
+    async def async_close(self) -> None:
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        await self.api.close()
+
+    async def _coalesce(self, key: tuple, factory: Callable[[], Awaitable[_T]]) -> _T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._async_with_renewal(factory))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _async_with_renewal(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        token = self._access_token
+        try:
+            return await request()
+        except WevoTokenRejectedError as err:
+            # Revoked or rotated before its expiry time: renew it now and try once more.
+            try:
+                if self._refresh_token is None:
+                    raise WevoAuthError(str(err)) from err
+                await self._async_refresh_token(rejected=token)
+            except WevoAuthError:
+                self._async_start_reauth()
+                raise
+        return await request()
+
+    def _entries(self) -> list[ConfigEntry]:
+        return [
+            entry
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id in self.entry_ids
+        ]
+
+
+@callback
+def _async_migrate_volatile_tokens(hass: HomeAssistant, token_store: WevoTokenStore, entry: ConfigEntry) -> None:
+    # Flows hand over fresh access tokens through the entry data; move them
+    # into the token store so token rotation never rewrites the entry.
+    if CONF_ACCESS_TOKEN not in entry.data:
+        return
+    token_store.async_adopt(
+        account_key(entry.data),
+        entry.data[CONF_ACCESS_TOKEN],
+        int(entry.data.get(CONF_EXPIRES_AT, 0)),
+    )
+    new_data = {k: v for k, v in entry.data.items() if k not in (CONF_ACCESS_TOKEN, CONF_EXPIRES_AT)}
+    hass.config_entries.async_update_entry(entry, data=new_data)
+
+
+def async_get_account(hass: HomeAssistant, entry: ConfigEntry) -> WevoAccount:
+    domain_data = hass.data[DOMAIN]
+    token_store: WevoTokenStore = domain_data[DATA_TOKEN_STORE]
+    _async_migrate_volatile_tokens(hass, token_store, entry)
+
+    accounts: dict[str, WevoAccount] = domain_data.setdefault(DATA_ACCOUNTS, {})
+    key = account_key(entry.data)
+    account = accounts.get(key)
+    if account is None:
+        account = accounts[key] = WevoAccount(hass, key, entry.data, token_store)
+        account.async_start()
+    account.entry_ids.add(entry.entry_id)
+    return account
+
+
+async def async_release_account(hass: HomeAssistant, account: WevoAccount, entry: ConfigEntry) -> None:
+    account.entry_ids.discard(entry.entry_id)
+    if account.entry_ids:
+        return
+    hass.data[DOMAIN][DATA_ACCOUNTS].pop(account.key, None)
+    await account.async_close()
@@ -15,16 +15,20 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([WevoAuthorizeButton(coordinator, entry)])
+    async_add_entities([WevoAuthorizeButton(coordinator, entry, connector) for connector in coordinator.connectors])
 
 
 class WevoAuthorizeButton(CoordinatorEntity, ButtonEntity):
     _attr_name = "Wevo Authorize Charging"
     _attr_icon = "mdi:ev-plug-type2"
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
         super().__init__(coordinator)
+        self._connector = connector
         self._attr_unique_id = f"{entry.entry_id}_authorize_charging"
+        if connector != coordinator.connectors[0]:
+            self._attr_unique_id += f"_connector_{connector}"
+            self._attr_name = f"{self._attr_name} Connector {connector}"
 
     async def async_press(self) -> None:
-        await self.coordinator.authorize()
+        await self.coordinator.authorize(self._connector)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -16,17 +17,33 @@ from .const import (
     CONF_COGNITO_USERNAME,
     CONF_COGNITO_REGION,
     CONF_CONNECTOR,
+    CONF_CONNECTORS,
     CONF_DRIVER_ID,
     CONF_EXPIRES_AT,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PUSH_MODE,
     CONF_REFRESH_TOKEN,
+    CONF_TARGET_ENERGY,
     DEFAULT_BASE_URL,
     DEFAULT_COGNITO_CLIENT_ID,
     DEFAULT_COGNITO_REGION,
     DEFAULT_CONNECTOR,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_PUSH_MODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TARGET_ENERGY,
+    DATA_ACCOUNTS,
     DOMAIN,
 )
-from .wevo_api import WevoApiClient, WevoApiError
+from .account import account_key, async_discover
+from .wevo_api import WevoApiClient, WevoApiError, WevoAuthError
+
+
+def _parse_connectors(value: Any) -> list[int]:
+    connectors = sorted({int(part) for part in str(value).replace(" ", "").split(",") if part})
+    if not connectors or connectors[0] < 1:
+        raise ValueError(value)
+    return connectors
 
 
 class WevoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -36,6 +53,7 @@ class WevoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._login_data: dict[str, Any] = {}
         self._chargers: list[str] = []
         self._driver_id: int | None = None
+        self._reauth_entry: config_entries.ConfigEntry | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
@@ -52,23 +70,14 @@ class WevoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             try:
                 tokens = await api.login(email, password)
-                details = await api.get_user_details(tokens.access_token)
-                txs = await api.get_transactions(tokens.access_token)
-
-                chargers = set()
-                assigned = details.get("chargerIdentifier")
-                if assigned:
-                    chargers.add(str(assigned))
-                for tx in txs:
-                    cid = tx.get("chargerIdentifier")
-                    if cid:
-                        chargers.add(str(cid))
-
-                if not chargers:
+                key = account_key({CONF_BASE_URL: base_url, CONF_COGNITO_USERNAME: tokens.cognito_username})
+                discovery = await async_discover(self.hass, api, key, tokens.access_token)
+
+                if not discovery.chargers:
                     errors["base"] = "no_chargers"
                 else:
-                    self._chargers = sorted(chargers)
-                    self._driver_id = details.get("userId")
+                    self._chargers = discovery.chargers
+                    self._driver_id = discovery.driver_id
                     self._login_data = {
                         CONF_ACCESS_TOKEN: tokens.access_token,
                         CONF_REFRESH_TOKEN: tokens.refresh_token,
@@ -79,6 +88,8 @@ class WevoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_COGNITO_USERNAME: tokens.cognito_username,
                     }
                     return await self.async_step_charger()
+            except WevoAuthError:
+                errors["base"] = "invalid_auth"
             except WevoApiError:
                 errors["base"] = "cannot_connect"
             except Exception:  # noqa: BLE001
@@ -103,26 +114,93 @@ class WevoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(f"{DOMAIN}_{charger_identifier}")
             self._abort_if_unique_id_configured()
 
-            data = {
-                **self._login_data,
-                CONF_CHARGER_IDENTIFIER: charger_identifier,
-                CONF_CONNECTOR: int(user_input.get(CONF_CONNECTOR, DEFAULT_CONNECTOR)),
-                CONF_SCAN_INTERVAL: int(user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
-            }
-            if self._driver_id is not None:
-                data[CONF_DRIVER_ID] = int(self._driver_id)
-
-            return self.async_create_entry(title=f"Wevo {charger_identifier}", data=data)
+            try:
+                connectors = _parse_connectors(user_input.get(CONF_CONNECTORS, DEFAULT_CONNECTOR))
+            except ValueError:
+                errors[CONF_CONNECTORS] = "invalid_connectors"
+            else:
+                data = {
+                    **self._login_data,
+                    CONF_CHARGER_IDENTIFIER: charger_identifier,
+                    CONF_CONNECTOR: connectors[0],
+                    CONF_CONNECTORS: connectors,
+                    CONF_SCAN_INTERVAL: int(user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+                    CONF_MAX_SCAN_INTERVAL: int(user_input.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)),
+                    CONF_PUSH_MODE: bool(user_input.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE)),
+                }
+                if self._driver_id is not None:
+                    data[CONF_DRIVER_ID] = int(self._driver_id)
+
+                return self.async_create_entry(title=f"Wevo {charger_identifier}", data=data)
 
         schema = vol.Schema(
             {
                 vol.Required(CONF_CHARGER_IDENTIFIER): vol.In(self._chargers),
-                vol.Optional(CONF_CONNECTOR, default=DEFAULT_CONNECTOR): vol.Coerce(int),
+                vol.Optional(CONF_CONNECTORS, default=str(DEFAULT_CONNECTOR)): str,
                 vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(int),
+                vol.Optional(CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL): vol.Coerce(int),
+                vol.Optional(CONF_PUSH_MODE, default=DEFAULT_PUSH_MODE): bool,
             }
         )
         return self.async_show_form(step_id="charger", data_schema=schema, errors=errors)
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]):
+        self._reauth_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
+        entry = self._reauth_entry
+        username = entry.data.get(CONF_COGNITO_USERNAME, "")
+
+        if user_input is not None:
+            session = async_get_clientsession(self.hass)
+            api = WevoApiClient(
+                session,
+                entry.data[CONF_BASE_URL],
+                entry.data[CONF_COGNITO_REGION],
+                entry.data[CONF_COGNITO_CLIENT_ID],
+            )
+            try:
+                tokens = await api.login(username, user_input["password"])
+            except WevoAuthError:
+                errors["base"] = "invalid_auth"
+            except WevoApiError:
+                errors["base"] = "cannot_connect"
+            except Exception:  # noqa: BLE001
+                errors["base"] = "unknown"
+            else:
+                key = account_key(entry.data)
+                account = self.hass.data.get(DOMAIN, {}).get(DATA_ACCOUNTS, {}).get(key)
+                if account is not None:
+                    account.async_set_tokens(tokens)
+                # Entries without a live account pick the new tokens up from their data on setup.
+                for other in self.hass.config_entries.async_entries(DOMAIN):
+                    if account_key(other.data) != key:
+                        continue
+                    if other.state is config_entries.ConfigEntryState.LOADED:
+                        # A coordinator that raised ConfigEntryAuthFailed stopped scheduling refreshes.
+                        coordinator = self.hass.data[DOMAIN].get(other.entry_id)
+                        if coordinator is not None:
+                            self.hass.async_create_task(coordinator.async_request_refresh())
+                        continue
+                    new_data = {
+                        **other.data,
+                        CONF_ACCESS_TOKEN: tokens.access_token,
+                        CONF_REFRESH_TOKEN: tokens.refresh_token,
+                        CONF_EXPIRES_AT: tokens.expires_at,
+                    }
+                    self.hass.config_entries.async_update_entry(other, data=new_data)
+                    self.hass.async_create_task(self.hass.config_entries.async_reload(other.entry_id))
+                return self.async_abort(reason="reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required("password"): str}),
+            description_placeholders={"username": username},
+            errors=errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -134,10 +212,20 @@ class WevoOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
+        data = self.config_entry.data
+
         if user_input is not None:
-            new_data = {**self.config_entry.data, **user_input}
-            self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-            return self.async_create_entry(title="", data={})
+            try:
+                connectors = _parse_connectors(user_input.pop(CONF_CONNECTORS))
+            except ValueError:
+                errors[CONF_CONNECTORS] = "invalid_connectors"
+            else:
+                new_data = {**data, **user_input, CONF_CONNECTOR: connectors[0], CONF_CONNECTORS: connectors}
+                self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
+                return self.async_create_entry(title="", data={})
+
+        connectors = data.get(CONF_CONNECTORS) or [data.get(CONF_CONNECTOR, DEFAULT_CONNECTOR)]
 
         schema = vol.Schema(
             {
@@ -146,9 +234,21 @@ class WevoOptionsFlow(config_entries.OptionsFlow):
                     default=self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                 ): vol.Coerce(int),
                 vol.Optional(
-                    CONF_CONNECTOR,
-                    default=self.config_entry.data.get(CONF_CONNECTOR, DEFAULT_CONNECTOR),
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=self.config_entry.data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
                 ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_CONNECTORS,
+                    default=",".join(str(connector) for connector in connectors),
+                ): str,
+                vol.Optional(
+                    CONF_PUSH_MODE,
+                    default=self.config_entry.data.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE),
+                ): bool,
+                vol.Optional(
+                    CONF_TARGET_ENERGY,
+                    default=self.config_entry.data.get(CONF_TARGET_ENERGY, DEFAULT_TARGET_ENERGY),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -1,21 +1,77 @@
 DOMAIN = "wevo_energy"
 PLATFORMS = ["sensor", "button"]
 
+DATA_ACCOUNTS = "accounts"
+DATA_TOKEN_STORE = "token_store"
+DATA_DISCOVERY = "discovery"
+DATA_SNAPSHOT_STORE = "snapshot_store"
+DATA_FLEET = "fleet"
+
+STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY = f"{DOMAIN}.tokens"
+TOKEN_SAVE_DELAY = 60
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshots"
+SNAPSHOT_SAVE_DELAY = 30
+
 CONF_ACCESS_TOKEN = "access_token"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_EXPIRES_AT = "expires_at"
 CONF_CHARGER_IDENTIFIER = "charger_identifier"
 CONF_CONNECTOR = "connector"
+CONF_CONNECTORS = "connectors"
 CONF_DRIVER_ID = "driver_id"
 CONF_BASE_URL = "base_url"
 CONF_COGNITO_REGION = "cognito_region"
 CONF_COGNITO_CLIENT_ID = "cognito_client_id"
 CONF_COGNITO_USERNAME = "cognito_username"
+CONF_PUSH_MODE = "push_mode"
+CONF_TARGET_ENERGY = "target_energy_kwh"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
 
 DEFAULT_BASE_URL = "https://api.wevo.energy/mobileapp"
 DEFAULT_SCAN_INTERVAL = 15
+DEFAULT_MAX_SCAN_INTERVAL = 600
+DEFAULT_PUSH_MODE = False
+DEFAULT_TARGET_ENERGY = 0.0
 DEFAULT_CONNECTOR = 1
 DEFAULT_COGNITO_REGION = "eu-central-1"
 DEFAULT_COGNITO_CLIENT_ID = "2amm11et52j39kubdekse641b6"
 
 TOKEN_REFRESH_MARGIN_SECONDS = 120
+TOKEN_REFRESH_RETRY_SECONDS = 60
+
+# Onboarding results are reused by further flows and first refreshes of the same account for this long.
+DISCOVERY_CACHE_TTL = 600
+
+# Normalized (lowercase, no separators) charger states that warrant fast polling.
+ACTIVE_STATES = {"charging", "preparing", "suspendedev", "suspendedevse", "finishing"}
+AUTHORIZE_FAST_POLL_SECONDS = 300
+# Leaving one of these states means a vehicle was plugged in and a new session started.
+UNPLUGGED_STATES = {"available", ""}
+
+# Power samples kept per connector for the moving average, and the longest gap integrated across.
+SAMPLE_BUFFER_SIZE = 20
+SAMPLE_MAX_GAP_SECONDS = 3600
+
+# Poll stages run concurrently, so a refresh takes at most the slowest of these.
+STATE_STAGE_TIMEOUT = 10
+TRANSACTIONS_STAGE_TIMEOUT = 15
+
+SERVICE_AUTHORIZE = "authorize"
+ATTR_CHARGER = "charger"
+ATTR_CONNECTOR = "connector"
+# Authorize commands a single service call runs at once.
+SERVICE_MAX_CONCURRENT = 8
+
+# Polls of all entries in flight at once; the rest queue, charging chargers first.
+FLEET_MAX_CONCURRENT = 4
+
+PUSH_SAFETY_INTERVAL = 300
+PUSH_RECONNECT_MIN = 5
+PUSH_RECONNECT_MAX = 300
+
+# Once the ledger holds history, only transactions started this long before its newest session are fetched.
+TRANSACTIONS_WINDOW_OVERLAP = 2 * 86400
+
+# Months of per-month ledger totals exposed as sensor attributes.
+LEDGER_MONTHS_EXPOSED = 24
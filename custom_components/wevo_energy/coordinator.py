@@ -1,109 +1,439 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from dataclasses import asdict, dataclass, fields, replace
 from datetime import timedelta
+from typing import Any, Awaitable, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .account import WevoAccount
 from .const import (
-    CONF_ACCESS_TOKEN,
-    CONF_BASE_URL,
+    ACTIVE_STATES,
+    AUTHORIZE_FAST_POLL_SECONDS,
     CONF_CHARGER_IDENTIFIER,
-    CONF_COGNITO_CLIENT_ID,
-    CONF_COGNITO_USERNAME,
-    CONF_COGNITO_REGION,
     CONF_CONNECTOR,
-    CONF_EXPIRES_AT,
-    CONF_REFRESH_TOKEN,
+    CONF_CONNECTORS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PUSH_MODE,
+    CONF_TARGET_ENERGY,
+    DATA_FLEET,
+    DATA_SNAPSHOT_STORE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_PUSH_MODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TARGET_ENERGY,
     DOMAIN,
-    TOKEN_REFRESH_MARGIN_SECONDS,
+    PUSH_RECONNECT_MAX,
+    PUSH_RECONNECT_MIN,
+    PUSH_SAFETY_INTERVAL,
+    STATE_STAGE_TIMEOUT,
+    TRANSACTIONS_STAGE_TIMEOUT,
+    TRANSACTIONS_WINDOW_OVERLAP,
+    UNPLUGGED_STATES,
 )
-from .wevo_api import WevoApiClient, WevoApiError
+from .ledger import WevoSessionLedger
+from .session import WevoSessionTracker
+from .wevo_api import WevoApiError, WevoAuthError, WevoCallStats, jittered
 
 
-class WevoCoordinator(DataUpdateCoordinator[dict]):
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+def entry_connectors(data: dict[str, Any]) -> list[str]:
+    connectors = data.get(CONF_CONNECTORS) or [data.get(CONF_CONNECTOR, 1)]
+    return [str(connector) for connector in connectors]
+
+
+def _normalize_state(state: Any) -> str:
+    return str(state or "").replace("_", "").replace(" ", "").lower()
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        return round(float(value), 3) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class WevoConnectorSnapshot:
+    """What entities need from one connector's getState frame, parsed once per update."""
+
+    state: str | None = None
+    rate_kw: float | None = None
+    total_energy_kwh: float | None = None
+    # Values reported by the charger itself, before the transaction history fallback.
+    live_rate_kw: float | None = None
+    live_energy_kwh: float | None = None
+    stale: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WevoConnectorSnapshot:
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+class WevoTransactionStore:
+    """Latest transaction per connector of one charger, reloaded only when asked to."""
+
+    def __init__(self, account: WevoAccount, charger_identifier: str) -> None:
+        self._account = account
+        self._charger_identifier = charger_identifier
+        self.loaded = False
+        self._latest: dict[str | None, dict[str, Any]] = {}
+
+    async def async_reload(self, since: int | None = None) -> list[dict[str, Any]]:
+        # A windowed reload only sees recent sessions; connectors without one keep their previous latest.
+        latest: dict[str | None, dict[str, Any]] = {}
+        mine: list[dict[str, Any]] = []
+        for tx in await self._account.async_get_transactions(since=since, cached=not self.loaded):
+            if tx.get("chargerIdentifier") not in (None, self._charger_identifier):
+                continue
+            mine.append(tx)
+            connector = tx.get("connector")
+            latest.setdefault(str(connector) if connector is not None else None, tx)
+        self._latest = {**self._latest, **latest} if since is not None else latest
+        self.loaded = True
+        return mine
+
+    def latest_for(self, connector: str) -> dict[str, Any] | None:
+        return self._latest.get(connector) or self._latest.get(None)
+
+
+class WevoCoordinator(DataUpdateCoordinator[dict[str, WevoConnectorSnapshot]]):
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, account: WevoAccount) -> None:
         self.hass = hass
         self.entry = entry
+        self.account = account
         data = entry.data
 
-        self._access_token = data[CONF_ACCESS_TOKEN]
-        self._refresh_token = data.get(CONF_REFRESH_TOKEN)
-        self._expires_at = int(data.get(CONF_EXPIRES_AT, 0))
-        self._cognito_username = data.get(CONF_COGNITO_USERNAME, "")
-
         self._charger_identifier = data[CONF_CHARGER_IDENTIFIER]
-        self._connector = str(data.get(CONF_CONNECTOR, 1))
-
-        session = async_get_clientsession(hass)
-        self._api = WevoApiClient(
-            session=session,
-            base_url=data[CONF_BASE_URL],
-            cognito_region=data[CONF_COGNITO_REGION],
-            cognito_client_id=data[CONF_COGNITO_CLIENT_ID],
-        )
+        self.connectors = entry_connectors(data)
+        self._push_mode = bool(data.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE))
+        self._push_task: asyncio.Task | None = None
+        self._reload_task: asyncio.Task | None = None
+        self._unsub_push: Callable[[], None] | None = None
+        self._transactions = WevoTransactionStore(account, self._charger_identifier)
+        self.ledger = WevoSessionLedger(hass, self._charger_identifier)
+        self._snapshot_store = hass.data[DOMAIN][DATA_SNAPSHOT_STORE]
+        self._persisted: dict[str, WevoConnectorSnapshot] | None = None
+        self.sessions = {connector: WevoSessionTracker() for connector in self.connectors}
+        self.target_energy_kwh = float(data.get(CONF_TARGET_ENERGY, DEFAULT_TARGET_ENERGY)) or None
+        self._last_states: dict[str, Any] = {}
+        self.poll_stats = WevoCallStats()
+        self.stale_stages: set[str] = set()
+
+        self._min_interval = int(data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        self._max_interval = max(self._min_interval, int(data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)))
+        self._idle_polls = 0
+        self._fast_poll_until = 0.0
+        self._backoff_until = 0.0
+        # Entries set up together (e.g. after a restart) would otherwise poll in lockstep forever.
+        self._fleet = hass.data[DOMAIN][DATA_FLEET]
+        self._phase = self._fleet.register(entry.entry_id)
 
+        # In push mode state arrives over the websocket and every pushed frame
+        # resets the refresh timer, so polling only happens when the socket is silent.
+        scan_interval = PUSH_SAFETY_INTERVAL if self._push_mode else self._min_interval
         super().__init__(
             hass,
             logger=logging.getLogger(__name__),
             name=DOMAIN,
-            update_interval=timedelta(seconds=data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+            update_interval=timedelta(seconds=scan_interval),
         )
 
-    async def _ensure_fresh_token(self) -> None:
-        now = int(time.time())
-        should_refresh = (
-            self._refresh_token is not None
-            and self._expires_at > 0
-            and now >= (self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS)
+    @callback
+    def async_restore_snapshot(self) -> bool:
+        restored = {
+            connector: replace(WevoConnectorSnapshot.from_dict(data), stale=True)
+            for connector, data in self._snapshot_store.get(self.entry.entry_id).items()
+            if connector in self.connectors
+        }
+        if not restored:
+            return False
+        # Shown as stale until the first live refresh replaces it.
+        self.data = restored
+        self._persisted = {connector: replace(snap, stale=False) for connector, snap in restored.items()}
+        return True
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, WevoConnectorSnapshot]) -> None:
+        # This re-arms the refresh timer, so pushes, reloads and authorize land on the poll grid too.
+        self._schedule_next_poll()
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self._record_samples()
+        self._async_persist_snapshot()
+        super().async_update_listeners()
+
+    def _record_samples(self) -> None:
+        now = time.monotonic()
+        for connector, snap in (self.data or {}).items():
+            tracker = self.sessions.get(connector)
+            if tracker is None or snap.stale:
+                continue
+            plugged = _normalize_state(snap.state) not in UNPLUGGED_STATES
+            tracker.add(now, plugged, snap.live_rate_kw, snap.live_energy_kwh)
+
+    @callback
+    def _async_persist_snapshot(self) -> None:
+        if not self.data or any(snap.stale for snap in self.data.values()) or self.data == self._persisted:
+            return
+        self._persisted = self.data
+        self._snapshot_store.async_set(
+            self.entry.entry_id, {connector: snap.as_dict() for connector, snap in self.data.items()}
         )
-        if not should_refresh:
+
+    def async_start_listening(self) -> None:
+        if self._unsub_push is not None:
             return
+        # Polling entries still take late replies and unsolicited state changes for their charger.
+        self._unsub_push = self.account.api.subscribe(
+            self._charger_identifier, self._handle_push_frame, unmatched_only=not self._push_mode
+        )
+        if not self._push_mode:
+            return
+        self._push_task = self.entry.async_create_background_task(
+            self.hass, self._async_push_loop(), f"{DOMAIN}_push_{self._charger_identifier}"
+        )
 
-        tokens = await self._api.refresh_access_token(self._refresh_token, self._cognito_username)
-        self._access_token = tokens.access_token
-        self._expires_at = tokens.expires_at
+    async def _async_push_loop(self) -> None:
+        backoff = PUSH_RECONNECT_MIN
+        while True:
+            try:
+                # Requesting state opens the shared socket and primes the charger feed.
+                await self.account.async_get_states(self._charger_identifier, self.connectors)
+                backoff = PUSH_RECONNECT_MIN
+                await self.account.api.wait_ws_closed()
+            except WevoApiError as err:
+                self.logger.debug("Wevo push connection failed: %s", err)
+                backoff = max(backoff, err.retry_after or 0)
+            await asyncio.sleep(jittered(backoff))
+            backoff = min(backoff * 2, PUSH_RECONNECT_MAX)
 
-        new_data = {
-            **self.entry.data,
-            CONF_ACCESS_TOKEN: self._access_token,
-            CONF_EXPIRES_AT: self._expires_at,
-        }
-        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+    @callback
+    def _handle_push_frame(self, frame: dict[str, Any]) -> None:
+        connector = frame.get("connector")
+        # Frames without a connector are for the first one, as the API client resolves its waiters.
+        connector = self.connectors[0] if connector is None else str(connector)
+        if connector not in self.connectors:
+            return
+        if "state" not in frame and "transactionData" not in frame:
+            return
+        self._apply_frame(connector, frame)
+
+    @callback
+    def _apply_frame(self, connector: str, frame: dict[str, Any]) -> None:
+        previous = (self.data or {}).get(connector)
+        if "state" not in frame and previous is not None:
+            # Meter-only pushes leave the connector state as it was.
+            frame = {**frame, "state": previous.state}
+        states = {**(self.data or {}), **self._build_data({connector: frame})}
+        if self._needs_transactions(states):
+            self._start_transactions_reload(states)
+        self.async_set_updated_data(states)
+
+    def _start_transactions_reload(self, states: dict[str, WevoConnectorSnapshot]) -> None:
+        # One reload at a time: states only count as seen once it succeeds, so any transition
+        # that arrives meanwhile still differs afterwards and triggers the next reload.
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        self._reload_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_reload_transactions(states),
+            f"{DOMAIN}_transactions_{self._charger_identifier}",
+        )
 
-    async def authorize(self) -> None:
-        await self._ensure_fresh_token()
+    async def _async_reload_transactions(self, states: dict[str, WevoConnectorSnapshot]) -> None:
         try:
-            await self._api.authorize(self._access_token, self._charger_identifier, self._connector)
-            await self.async_request_refresh()
+            async with self._fleet.slot():
+                ok, _ = await self._async_stage(
+                    "transactions", self._async_reload_history(), TRANSACTIONS_STAGE_TIMEOUT
+                )
+        except ConfigEntryAuthFailed:
+            return
+        if not ok:
+            return
+        self._remember_states(states)
+        current = self.data or states
+        self.async_set_updated_data(
+            {connector: replace(
+                self._snapshot(connector, snap.state, snap.live_rate_kw, snap.live_energy_kwh), stale=snap.stale
+            ) for connector, snap in current.items()}
+        )
+
+    async def _async_reload_history(self) -> None:
+        # Finished sessions are kept locally so history never needs another cloud fetch, not even after a restart.
+        since = None
+        if self.ledger.newest_start:
+            since = self.ledger.newest_start - TRANSACTIONS_WINDOW_OVERLAP
+        await self.ledger.async_ingest(await self._transactions.async_reload(since))
+
+    def _needs_transactions(self, states: dict[str, WevoConnectorSnapshot]) -> bool:
+        # Session history only moves when a connector changes state (e.g. a
+        # session ends), so transactions are fetched on transitions only.
+        if not self._transactions.loaded:
+            return True
+        return any(snap.state != self._last_states.get(connector) for connector, snap in states.items())
+
+    def _remember_states(self, states: dict[str, WevoConnectorSnapshot]) -> None:
+        self._last_states = {connector: snap.state for connector, snap in states.items()}
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_push is not None:
+            self._unsub_push()
+            self._unsub_push = None
+        if self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
+        self._fleet.unregister(self.entry.entry_id)
+        await super().async_shutdown()
+
+    def _adapt_interval(self, states: dict[str, WevoConnectorSnapshot]) -> None:
+        if not self._push_mode:
+            if self._is_active(states):
+                self._idle_polls = 0
+            else:
+                # Idle, unplugged or faulted chargers back off exponentially.
+                self._idle_polls = min(self._idle_polls + 1, 16)
+        self._schedule_next_poll()
+
+    def _is_active(self, states: dict[str, WevoConnectorSnapshot] | None) -> bool:
+        if time.monotonic() < self._fast_poll_until:
+            return True
+        return any(_normalize_state(snap.state) in ACTIVE_STATES for snap in (states or {}).values())
+
+    def _schedule_next_poll(self) -> None:
+        now = time.monotonic()
+        if self._push_mode:
+            # Safety polls only run once the socket has been silent for the whole interval.
+            delay = float(PUSH_SAFETY_INTERVAL)
+        else:
+            seconds = min(self._max_interval, self._min_interval * 2 ** self._idle_polls)
+            # Polls land on this entry's own slot of the interval grid, so the fleet stays spread out
+            # however long each poll takes and whatever the interval grows to.
+            offset = self._phase * seconds
+            delay = offset + ((now - offset) // seconds + 1) * seconds - now
+            # The timer fires up to a second early; a slot that close is the one just polled for.
+            if delay < seconds / 2:
+                delay += seconds
+        # A throttled or tripped host said when to come back; polling earlier only gets rejected.
+        delay = max(delay, self._backoff_until - now)
+        self.update_interval = timedelta(seconds=delay)
+
+    async def authorize(self, connector: str | None = None, refresh: bool = True) -> dict[str, Any] | None:
+        self._fast_poll_until = time.monotonic() + AUTHORIZE_FAST_POLL_SECONDS
+        if not self._push_mode:
+            self._idle_polls = 0
+            self._schedule_next_poll()
+        connector = connector or self.connectors[0]
+        try:
+            frame = await self.account.async_authorize(self._charger_identifier, connector)
+        except WevoAuthError as err:
+            raise ConfigEntryAuthFailed(str(err)) from err
         except WevoApiError as err:
             raise UpdateFailed(f"Authorize failed: {err}") from err
 
-    async def _async_update_data(self) -> dict:
-        await self._ensure_fresh_token()
+        # The confirming state frame already carries what a refresh would fetch.
+        if frame is not None and "state" in frame:
+            self._apply_frame(connector, frame)
+        elif refresh:
+            await self.async_request_refresh()
+        return frame
+
+    def _snapshot(
+        self, connector: str, state: str | None, live_rate_kw: float | None, live_energy_kwh: float | None
+    ) -> WevoConnectorSnapshot:
+        rate_kw, energy_kwh = live_rate_kw, live_energy_kwh
+        latest = self._transactions.latest_for(connector)
+        if latest:
+            if not rate_kw:
+                rate_kw = _as_float(latest.get("avgRateKW"))
+            if not energy_kwh:
+                energy_kwh = _as_float(latest.get("totalEnergyKwh"))
+        return WevoConnectorSnapshot(state, rate_kw, energy_kwh, live_rate_kw, live_energy_kwh)
+
+    def _build_data(self, frames: dict[str, dict]) -> dict[str, WevoConnectorSnapshot]:
+        snapshots = {}
+        for connector, frame in frames.items():
+            tx = frame.get("transactionData") or {}
+            state = frame.get("state")
+            snapshots[connector] = self._snapshot(
+                connector,
+                str(state) if state is not None else None,
+                _as_float(tx.get("rateKw")),
+                _as_float(tx.get("totalEnergyKwh")),
+            )
+        return snapshots
+
+    async def _async_update_data(self) -> dict[str, WevoConnectorSnapshot]:
+        # Charging connectors jump the queue when many entries are due at once.
+        async with self._fleet.slot(priority=self._is_active(self.data)):
+            start = time.perf_counter()
+            ok = False
+            try:
+                data = await self._async_poll()
+                # Carrying the last state over is not a successful poll, even though nothing is raised.
+                ok = "state" not in self.stale_stages
+                return data
+            finally:
+                self.poll_stats.record((time.perf_counter() - start) * 1000, ok)
+
+    async def _async_stage(self, name: str, coro: Awaitable[Any], timeout: float) -> tuple[bool, Any]:
         try:
-            data = await self._api.get_state(self._access_token, self._charger_identifier, self._connector)
-
-            tx = data.get("transactionData") or {}
-            rate_kw = tx.get("rateKw")
-            energy_kwh = tx.get("totalEnergyKwh")
-
-            transactions = await self._api.get_transactions(self._access_token)
-            if transactions:
-                latest = transactions[0]
-                if rate_kw in (None, 0, 0.0):
-                    rate_kw = latest.get("avgRateKW")
-                if energy_kwh in (None, 0, 0.0):
-                    energy_kwh = latest.get("totalEnergyKwh")
-
-            data["rate_kw"] = rate_kw
-            data["total_energy_kwh"] = energy_kwh
-            return data
-        except WevoApiError as err:
-            raise UpdateFailed(str(err)) from err
+            result = await asyncio.wait_for(coro, timeout)
+        except WevoAuthError as err:
+            raise ConfigEntryAuthFailed(str(err)) from err
+        except (WevoApiError, asyncio.TimeoutError) as err:
+            self.logger.debug("Wevo %s fetch failed: %s", name, err or "timed out")
+            self.stale_stages.add(name)
+            retry_after = getattr(err, "retry_after", None)
+            if retry_after:
+                self._backoff_until = max(self._backoff_until, time.monotonic() + retry_after)
+            return False, err
+        self.stale_stages.discard(name)
+        return True, result
+
+    async def _async_poll(self) -> dict[str, WevoConnectorSnapshot]:
+        stages = [
+            self._async_stage(
+                "state",
+                self.account.async_get_states(self._charger_identifier, self.connectors),
+                STATE_STAGE_TIMEOUT,
+            )
+        ]
+        first_load = not self._transactions.loaded
+        if first_load:
+            stages.append(
+                self._async_stage("transactions", self._async_reload_history(), TRANSACTIONS_STAGE_TIMEOUT)
+            )
+        (ok, frames), *_ = await asyncio.gather(*stages)
+
+        if not ok:
+            self._schedule_next_poll()
+            if not self.data:
+                raise UpdateFailed(f"Unable to fetch charger state: {frames or 'timed out'}")
+            # Keep the last known good state, flagged so entities can show it is stale.
+            return {connector: replace(snap, stale=True) for connector, snap in self.data.items()}
+
+        states = self._build_data(frames)
+
+        if first_load and self._transactions.loaded:
+            self._remember_states(states)
+        elif self._needs_transactions(states):
+            # A state transition moved session history; reload it without holding up this refresh.
+            self._start_transactions_reload(states)
+        self._adapt_interval(states)
+        return states
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ACCESS_TOKEN, CONF_COGNITO_USERNAME, CONF_DRIVER_ID, CONF_REFRESH_TOKEN, DATA_FLEET, DOMAIN
+
+TO_REDACT = {CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, CONF_COGNITO_USERNAME, CONF_DRIVER_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+            "poll": coordinator.poll_stats.as_dict(),
+            "stale_stages": sorted(coordinator.stale_stages),
+            "data": {connector: snap.as_dict() for connector, snap in (coordinator.data or {}).items()},
+        },
+        "api": {
+            **coordinator.account.api.stats.as_dict(),
+            "circuits": coordinator.account.api.circuit_states(),
+        },
+        "fleet": hass.data[DOMAIN][DATA_FLEET].as_dict(),
+    }
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from .const import FLEET_MAX_CONCURRENT
+
+
+class WevoFleetScheduler:
+    """Shared by every entry: spreads poll phases and bounds how many polls hit the cloud at once.
+
+    Slots are handed out by priority, so chargers that are charging are polled
+    ahead of idle ones when the fleet is saturated.
+    """
+
+    def __init__(self, max_concurrent: int = FLEET_MAX_CONCURRENT) -> None:
+        self.max_concurrent = max_concurrent
+        self._available = max_concurrent
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._phases: dict[str, float] = {}
+        self.peak_queued = 0
+
+    def register(self, key: str) -> float:
+        """Return a phase in [0, 1) in the middle of the widest gap between registered phases."""
+        points = sorted(self._phases.values())
+        phase = 0.0
+        if points:
+            gap, start = max((end - begin, begin) for begin, end in zip(points, points[1:] + [points[0] + 1]))
+            phase = (start + gap / 2) % 1
+        self._phases[key] = phase
+        return phase
+
+    def unregister(self, key: str) -> None:
+        self._phases.pop(key, None)
+
+    @asynccontextmanager
+    async def slot(self, priority: bool = False) -> AsyncIterator[None]:
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: bool) -> None:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (0 if priority else 1, next(self._order), future))
+        self.peak_queued = max(self.peak_queued, len(self._waiters))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot handed over just before the cancellation has to be passed on.
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._phases),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.max_concurrent - self._available,
+            "queued": sum(1 for _, _, future in self._waiters if not future.done()),
+            "peak_queued": self.peak_queued,
+        }
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, LEDGER_MONTHS_EXPOSED
+from .wevo_api import TRANSACTION_END_KEYS, TRANSACTION_START_KEYS, transaction_timestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+# transaction id hash, session start, session end (UTC epoch seconds), energy kWh
+_RECORD = struct.Struct("<qqqd")
+
+
+def _record_id(tx: dict[str, Any]) -> int | None:
+    raw = tx.get("transactionId", tx.get("id"))
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        digest = hashlib.blake2b(str(raw).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+
+class WevoSessionLedger:
+    """Append-only local record of completed charging sessions for one charger.
+
+    Each session is a fixed-width 32 byte record so the file can be appended
+    to without rewriting and loaded with a single read.
+    """
+
+    def __init__(self, hass: HomeAssistant, charger_identifier: str) -> None:
+        self.hass = hass
+        self._slug = slugify(charger_identifier)
+        self._path = hass.config.path(".storage", f"{DOMAIN}_ledger_{self._slug}.bin")
+        self.statistic_id = f"{DOMAIN}:energy_{self._slug}"
+        self._name = f"Wevo {charger_identifier} energy"
+        self._ids: set[int] = set()
+        self._sessions: list[tuple[int, float]] = []
+        self.total_kwh = 0.0
+        self.newest_start = 0
+        # Kept up to date as sessions arrive so state writes never walk the whole ledger.
+        self._monthly: dict[str, float] = {}
+        self._monthly_exposed: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        records = await self.hass.async_add_executor_job(self._read)
+        for record_id, start, end, energy in records:
+            # An append cancelled mid-write may have landed anyway and been written again on retry.
+            if record_id in self._ids:
+                continue
+            self._ids.add(record_id)
+            self._add_session(start, end, energy)
+        self._sessions.sort()
+        self._expose_months()
+
+    async def async_ingest(self, transactions: list[dict[str, Any]]) -> int:
+        new: list[tuple[int, int, int, float]] = []
+        batch: set[int] = set()
+        for tx in transactions:
+            record_id = _record_id(tx)
+            end = transaction_timestamp(tx, TRANSACTION_END_KEYS)
+            energy = tx.get("totalEnergyKwh")
+            # Only finished sessions are final; running ones are picked up once they end.
+            if record_id is None or record_id in self._ids or record_id in batch or end is None or energy is None:
+                continue
+            start = transaction_timestamp(tx, TRANSACTION_START_KEYS) or end
+            batch.add(record_id)
+            new.append((record_id, start, end, float(energy)))
+
+        if not new:
+            return 0
+
+        await self.hass.async_add_executor_job(self._append, new)
+        # Only written sessions count as seen; a failed or cancelled append is retried next reload.
+        self._ids |= batch
+        for _record_id_, start, end, energy in new:
+            self._add_session(start, end, energy)
+        self._sessions.sort()
+        self._expose_months()
+        self._import_statistics(min(end for _, _, end, _ in new))
+        return len(new)
+
+    def monthly_totals(self) -> dict[str, float]:
+        return self._monthly_exposed
+
+    def _add_session(self, start: int, end: int, energy: float) -> None:
+        self._sessions.append((end, energy))
+        self.total_kwh += energy
+        self.newest_start = max(self.newest_start, start)
+        month = dt_util.as_local(datetime.fromtimestamp(end, timezone.utc)).strftime("%Y-%m")
+        self._monthly[month] = self._monthly.get(month, 0.0) + energy
+
+    def _expose_months(self) -> None:
+        months = sorted(self._monthly)[-LEDGER_MONTHS_EXPOSED:]
+        self._monthly_exposed = {month: round(self._monthly[month], 3) for month in months}
+
+    def _import_statistics(self, since: int) -> None:
+        if "recorder" not in self.hass.config.components:
+            return
+        # Imported here so loading the integration does not pull in the recorder modules.
+        from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        # Rebuild hourly sums from the earliest new session so late arrivals stay consistent.
+        since_hour = since - since % 3600
+        hourly: dict[int, float] = {}
+        running = 0.0
+        for end, energy in self._sessions:
+            running += energy
+            hour = end - end % 3600
+            if hour >= since_hour:
+                hourly[hour] = running
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=self._name,
+            source=DOMAIN,
+            statistic_id=self.statistic_id,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        statistics = [
+            StatisticData(start=datetime.fromtimestamp(hour, timezone.utc), state=total, sum=total)
+            for hour, total in sorted(hourly.items())
+        ]
+        async_add_external_statistics(self.hass, metadata, statistics)
+
+    def _read(self) -> list[tuple[int, int, int, float]]:
+        try:
+            with open(self._path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return []
+        usable = len(data) - len(data) % _RECORD.size
+        if usable != len(data):
+            _LOGGER.warning("Ignoring truncated trailing record in %s", self._path)
+        return list(_RECORD.iter_unpack(data[:usable]))
+
+    def _append(self, records: list[tuple[int, int, int, float]]) -> None:
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(self._path, "ab") as file:
+            file.write(b"".join(_RECORD.pack(*record) for record in records))
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfEnergy, UnitOfPower, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import WevoConnectorSnapshot
 
 
 async def async_setup_entry(
@@ -16,14 +17,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        [
-            WevoStateSensor(coordinator, entry),
-            WevoChargingRateSensor(coordinator, entry),
-            WevoSessionEnergySensor(coordinator, entry),
-        ],
-        True,
-    )
+    entities: list[SensorEntity] = []
+    for connector in coordinator.connectors:
+        entities += [
+            WevoStateSensor(coordinator, entry, connector),
+            WevoChargingRateSensor(coordinator, entry, connector),
+            WevoSessionEnergySensor(coordinator, entry, connector),
+            WevoIntegratedEnergySensor(coordinator, entry, connector),
+            WevoAveragePowerSensor(coordinator, entry, connector),
+            WevoTimeToTargetSensor(coordinator, entry, connector),
+        ]
+    entities += [
+        WevoLifetimeEnergySensor(coordinator, entry),
+        WevoPollLatencySensor(coordinator, entry),
+        WevoPollSuccessRateSensor(coordinator, entry),
+    ]
+    async_add_entities(entities)
 
 
 class WevoBaseSensor(CoordinatorEntity, SensorEntity):
@@ -31,42 +40,183 @@ class WevoBaseSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._written: tuple | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Most refreshes leave a sensor untouched; skipping those spares the state machine and recorder.
+        written = (self.available, self.native_value, self.extra_state_attributes)
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+
+class WevoConnectorSensor(WevoBaseSensor):
+    def __init__(self, coordinator, entry: ConfigEntry, key: str, connector: str) -> None:
+        # The first connector keeps the original unique ids so upgrades do not orphan entities.
+        primary = connector == coordinator.connectors[0]
+        super().__init__(coordinator, entry, key if primary else f"{key}_connector_{connector}")
+        self._connector = connector
+        if not primary:
+            self._attr_name = f"{self._attr_name} Connector {connector}"
+
+    @property
+    def connector_data(self) -> WevoConnectorSnapshot:
+        return (self.coordinator.data or {}).get(self._connector) or WevoConnectorSnapshot()
+
+    @property
+    def extra_state_attributes(self):
+        # Set when the last refresh could not reach the charger and values are carried over.
+        return {"stale": self.connector_data.stale}
 
 
-class WevoStateSensor(WevoBaseSensor):
+class WevoStateSensor(WevoConnectorSensor):
     _attr_name = "Wevo Charging State"
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "charging_state")
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "charging_state", connector)
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("state")
+        return self.connector_data.state
 
 
-class WevoChargingRateSensor(WevoBaseSensor):
+class WevoChargingRateSensor(WevoConnectorSensor):
     _attr_name = "Wevo Charging Speed"
     _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
     _attr_device_class = SensorDeviceClass.POWER
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "charging_speed_kw")
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "charging_speed_kw", connector)
 
     @property
     def native_value(self):
-        value = self.coordinator.data.get("rate_kw")
-        return round(float(value), 3) if value is not None else None
+        return self.connector_data.rate_kw
 
 
-class WevoSessionEnergySensor(WevoBaseSensor):
+class WevoSessionEnergySensor(WevoConnectorSensor):
     _attr_name = "Wevo Session Energy"
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_device_class = SensorDeviceClass.ENERGY
 
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "session_energy_kwh", connector)
+
+    @property
+    def native_value(self):
+        return self.connector_data.total_energy_kwh
+
+
+class WevoIntegratedEnergySensor(WevoConnectorSensor):
+    _attr_name = "Wevo Integrated Session Energy"
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "integrated_session_energy_kwh", connector)
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.sessions[self._connector].integrated_kwh, 3)
+
+
+class WevoAveragePowerSensor(WevoConnectorSensor):
+    _attr_name = "Wevo Average Charging Speed"
+    _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "average_charging_speed_kw", connector)
+
+    @property
+    def native_value(self):
+        value = self.coordinator.sessions[self._connector].average_kw
+        return round(value, 3) if value is not None else None
+
+
+class WevoTimeToTargetSensor(WevoConnectorSensor):
+    _attr_name = "Wevo Time To Target Energy"
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+
+    def __init__(self, coordinator, entry: ConfigEntry, connector: str) -> None:
+        super().__init__(coordinator, entry, "time_to_target_energy", connector)
+
+    @property
+    def native_value(self):
+        target = self.coordinator.target_energy_kwh
+        if target is None:
+            return None
+        value = self.coordinator.sessions[self._connector].minutes_to(target)
+        return round(value) if value is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {**super().extra_state_attributes, "target_kwh": self.coordinator.target_energy_kwh}
+
+
+class WevoLifetimeEnergySensor(WevoBaseSensor):
+    _attr_name = "Wevo Lifetime Energy"
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry, "lifetime_energy_kwh")
+
+    @property
+    def available(self) -> bool:
+        # Backed by the local session ledger, so it does not depend on the cloud being reachable.
+        return True
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.ledger.total_kwh, 3)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "monthly_kwh": self.coordinator.ledger.monthly_totals(),
+            "statistic_id": self.coordinator.ledger.statistic_id,
+        }
+
+
+class WevoDiagnosticSensor(WevoBaseSensor):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def available(self) -> bool:
+        # Poll health stays reportable while the polls themselves are failing.
+        return True
+
+
+class WevoPollLatencySensor(WevoDiagnosticSensor):
+    _attr_name = "Wevo Last Poll Latency"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+
+    def __init__(self, coordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry, "last_poll_latency_ms")
+
+    @property
+    def native_value(self):
+        value = self.coordinator.poll_stats.last_ms
+        return round(value, 1) if value is not None else None
+
+
+class WevoPollSuccessRateSensor(WevoDiagnosticSensor):
+    _attr_name = "Wevo Poll Success Rate"
+    _attr_native_unit_of_measurement = PERCENTAGE
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "session_energy_kwh")
+        super().__init__(coordinator, entry, "poll_success_rate")
 
     @property
     def native_value(self):
-        value = self.coordinator.data.get("total_energy_kwh")
-        return round(float(value), 3) if value is not None else None
+        value = self.coordinator.poll_stats.success_rate
+        return round(value * 100, 1) if value is not None else None
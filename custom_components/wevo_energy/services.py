@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    ATTR_CHARGER,
+    ATTR_CONNECTOR,
+    CONF_CHARGER_IDENTIFIER,
+    DOMAIN,
+    SERVICE_AUTHORIZE,
+    SERVICE_MAX_CONCURRENT,
+)
+from .coordinator import WevoCoordinator
+
+# Starting charging sessions is never a default: every call names its entries or chargers.
+AUTHORIZE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_CHARGER): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_CONNECTOR): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_CONFIG_ENTRY_ID, ATTR_CHARGER),
+)
+
+
+def _target_coordinators(hass: HomeAssistant, data: dict[str, Any]) -> tuple[list[WevoCoordinator], list[str]]:
+    # Requested entries and chargers that match no loaded entry are returned alongside, to be reported.
+    entry_ids = set(data.get(ATTR_CONFIG_ENTRY_ID, ()))
+    chargers = set(data.get(ATTR_CHARGER, ()))
+    coordinators = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED:
+            continue
+        if entry_ids and entry.entry_id not in entry_ids:
+            continue
+        if chargers and entry.data[CONF_CHARGER_IDENTIFIER] not in chargers:
+            continue
+        coordinators.append(hass.data[DOMAIN][entry.entry_id])
+    unmatched = sorted(
+        (entry_ids - {coordinator.entry.entry_id for coordinator in coordinators})
+        | (chargers - {coordinator.entry.data[CONF_CHARGER_IDENTIFIER] for coordinator in coordinators})
+    )
+    return coordinators, unmatched
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def _async_authorize(call: ServiceCall) -> ServiceResponse:
+        coordinators, unmatched = _target_coordinators(hass, call.data)
+        if not coordinators:
+            raise ServiceValidationError(f"No loaded Wevo charger matches {', '.join(unmatched)}")
+        connector = call.data.get(ATTR_CONNECTOR)
+        connector = str(connector) if connector is not None else None
+        semaphore = asyncio.Semaphore(SERVICE_MAX_CONCURRENT)
+
+        async def _authorize_one(coordinator: WevoCoordinator) -> tuple[bool, dict[str, Any]]:
+            if connector is not None and connector not in coordinator.connectors:
+                return False, {"success": False, "error": f"Connector {connector} is not configured"}
+            async with semaphore:
+                try:
+                    frame = await coordinator.authorize(connector, refresh=False)
+                except ConfigEntryAuthFailed as err:
+                    coordinator.entry.async_start_reauth(hass)
+                    return False, {"success": False, "error": str(err)}
+                except UpdateFailed as err:
+                    return False, {"success": False, "error": str(err)}
+            state = frame.get("state") if frame else None
+            return state is None, {"success": True, "confirmed": frame is not None, "state": state}
+
+        outcomes = await asyncio.gather(*(_authorize_one(coordinator) for coordinator in coordinators))
+
+        # Chargers that did not confirm with a state frame are refreshed together, once each.
+        await asyncio.gather(
+            *(
+                coordinator.async_request_refresh()
+                for coordinator, (needs_refresh, _) in zip(coordinators, outcomes)
+                if needs_refresh
+            )
+        )
+        if not call.return_response:
+            return None
+        results: dict[str, Any] = {
+            target: {"success": False, "error": "No loaded Wevo charger matches this target"} for target in unmatched
+        }
+        results.update(
+            (coordinator.entry.data[CONF_CHARGER_IDENTIFIER], result)
+            for coordinator, (_, result) in zip(coordinators, outcomes)
+        )
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_AUTHORIZE,
+        _async_authorize,
+        schema=AUTHORIZE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import deque
+
+from .const import SAMPLE_BUFFER_SIZE, SAMPLE_MAX_GAP_SECONDS
+
+
+class WevoSessionTracker:
+    """Rolling power samples of one connector, integrated as they arrive.
+
+    Each sample costs O(1): the segment since the previous sample is added to
+    the session total, and the window sums drop whichever segment the ring
+    buffer evicts.
+    """
+
+    def __init__(self, size: int = SAMPLE_BUFFER_SIZE) -> None:
+        # (hours, kWh) of the segment ending at each sample.
+        self._segments: deque[tuple[float, float]] = deque(maxlen=size)
+        self._window_hours = 0.0
+        self._window_kwh = 0.0
+        self._last: tuple[float, float] | None = None
+        self._plugged = False
+        self.integrated_kwh = 0.0
+        self.reported_kwh: float | None = None
+
+    def reset(self) -> None:
+        self._segments.clear()
+        self._window_hours = 0.0
+        self._window_kwh = 0.0
+        self._last = None
+        self.integrated_kwh = 0.0
+        self.reported_kwh = None
+
+    def add(self, now: float, plugged: bool, rate_kw: float | None, energy_kwh: float | None) -> None:
+        new_session = plugged and not self._plugged
+        if energy_kwh is not None and self.reported_kwh is not None and energy_kwh < self.reported_kwh:
+            # The charger restarted its meter, which only happens on a new session.
+            new_session = True
+        if new_session:
+            self.reset()
+        self._plugged = plugged
+
+        rate = max(rate_kw or 0.0, 0.0)
+        if self._last is not None:
+            then, previous = self._last
+            seconds = now - then
+            # Across long gaps (restarts, outages) the shape of the curve is unknown, so it is not guessed.
+            if 0 < seconds <= SAMPLE_MAX_GAP_SECONDS:
+                hours = seconds / 3600
+                kwh = (previous + rate) / 2 * hours
+                self.integrated_kwh += kwh
+                if len(self._segments) == self._segments.maxlen:
+                    old_hours, old_kwh = self._segments[0]
+                    self._window_hours -= old_hours
+                    self._window_kwh -= old_kwh
+                self._segments.append((hours, kwh))
+                self._window_hours += hours
+                self._window_kwh += kwh
+        self._last = (now, rate)
+        if energy_kwh is not None:
+            self.reported_kwh = energy_kwh
+
+    @property
+    def average_kw(self) -> float | None:
+        if self._window_hours <= 0:
+            return None
+        return max(self._window_kwh / self._window_hours, 0.0)
+
+    @property
+    def session_kwh(self) -> float:
+        # The charger's own meter wins when it reports one; the integral fills in when it does not.
+        return self.reported_kwh if self.reported_kwh else self.integrated_kwh
+
+    def minutes_to(self, target_kwh: float) -> float | None:
+        remaining = target_kwh - self.session_kwh
+        if remaining <= 0:
+            return 0.0
+        average = self.average_kw
+        if not average:
+            return None
+        return remaining / average * 60
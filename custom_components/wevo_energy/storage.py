@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_KEY, STORAGE_VERSION, TOKEN_SAVE_DELAY, TOKEN_STORAGE_KEY
+
+
+class WevoTokenStore:
+    """Short-lived access tokens, kept out of the config entries and saved lazily."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, TOKEN_STORAGE_KEY)
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    def get(self, key: str) -> tuple[str, int]:
+        tokens = self._data.get(key) or {}
+        return tokens.get("access_token", ""), int(tokens.get("expires_at", 0))
+
+    @callback
+    def async_set(self, key: str, access_token: str, expires_at: int) -> None:
+        self._data[key] = {"access_token": access_token, "expires_at": expires_at}
+        # Tokens rotate hourly; batching the writes keeps flash storage and the loop quiet.
+        self._store.async_delay_save(lambda: self._data, TOKEN_SAVE_DELAY)
+
+    @callback
+    def async_adopt(self, key: str, access_token: str, expires_at: int) -> None:
+        if expires_at >= self.get(key)[1]:
+            self.async_set(key, access_token, expires_at)
+
+
+class WevoSnapshotStore:
+    """Last known connector states per entry, so entities start with values before the cloud answers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    def get(self, entry_id: str) -> dict[str, dict[str, Any]]:
+        return self._data.get(entry_id) or {}
+
+    @callback
+    def async_set(self, entry_id: str, snapshots: dict[str, dict[str, Any]]) -> None:
+        self._data[entry_id] = snapshots
+        self._store.async_delay_save(lambda: self._data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        if self._data.pop(entry_id, None) is not None:
+            self._store.async_delay_save(lambda: self._data, SNAPSHOT_SAVE_DELAY)
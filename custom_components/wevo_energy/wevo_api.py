@@ -1,16 +1,233 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterator, Mapping, TypeVar
+from urllib.parse import urlsplit
 
-from aiohttp import ClientSession, WSMsgType
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, WSMsgType, WSServerHandshakeError
+
+_T = TypeVar("_T")
+
+WS_HEARTBEAT = 20
+WS_CONNECT_TIMEOUT = 15
+# Deadlines cover the whole exchange (connect, send and replies), whatever other traffic shares the socket.
+WS_COMMAND_TIMEOUT = 9
+WS_AUTHORIZE_TIMEOUT = 10
+WS_BACKOFF_MIN = 1
+WS_BACKOFF_MAX = 300
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+AUTHORIZE_REJECTED_STATUSES = {"rejected", "failed", "error", "invalid", "blocked"}
+# Waiter key for state frames confirming an authorize; only frames no getState waiter claims reach it.
+_AUTHORIZE_STATE = "authorizeState"
+# Consecutive transient failures before a host's circuit opens, and how long it stays open.
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_MIN = 30
+BREAKER_RESET_MAX = 600
+REST_RETRIES = 2
+COGNITO_RETRIES = 1
+RETRY_BACKOFF = 1.0
+
+# Bodies larger than this are decoded in an executor so a long history cannot stall the loop.
+JSON_EXECUTOR_THRESHOLD = 256 * 1024
+
+TRANSACTION_START_KEYS = ("startTime", "startDate", "start")
+TRANSACTION_END_KEYS = ("endTime", "stopTime", "endDate", "stopDate", "end")
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
 
 
 class WevoApiError(Exception):
     """Raised when Wevo API returns an error."""
 
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class WevoAuthError(WevoApiError):
+    """Raised when Cognito rejects the supplied credentials or refresh token."""
+
+
+class WevoTokenRejectedError(WevoApiError):
+    """Raised when Wevo rejects an access token that has not reached its expiry time."""
+
+
+class WevoThrottledError(WevoApiError):
+    """Raised when Wevo or Cognito asks the client to slow down."""
+
+
+class WevoServerError(WevoApiError):
+    """Raised when Wevo or Cognito fails on its side (5xx)."""
+
+
+class WevoConnectionError(WevoApiError):
+    """Raised when Wevo or Cognito cannot be reached."""
+
+
+class WevoCircuitOpenError(WevoApiError):
+    """Raised without contacting a host whose circuit breaker is open."""
+
+
+TRANSIENT_ERRORS = (WevoThrottledError, WevoServerError, WevoConnectionError)
+
+
+def jittered(delay: float) -> float:
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _retry_after(headers: Mapping[str, str] | None) -> float | None:
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _http_error(message: str, status: int, headers: Mapping[str, str] | None = None) -> WevoApiError:
+    if status in (401, 403):
+        return WevoTokenRejectedError(message)
+    if status == 429:
+        return WevoThrottledError(message, _retry_after(headers))
+    if status >= 500:
+        return WevoServerError(message, _retry_after(headers))
+    return WevoApiError(message)
+
+
+class WevoCircuitBreaker:
+    """Stops calls to a host after repeated transient failures, then lets a single probe through."""
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if time.monotonic() < self.open_until:
+            return "open"
+        return "half_open" if self.failures >= BREAKER_THRESHOLD else "closed"
+
+    def before_call(self) -> None:
+        remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            raise WevoCircuitOpenError(f"Circuit open, retrying in {remaining:.0f}s", retry_after=remaining)
+        if self.failures >= BREAKER_THRESHOLD:
+            if self._probing:
+                raise WevoCircuitOpenError("Circuit half-open, probe in progress", retry_after=BREAKER_RESET_MIN)
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self._probing = False
+
+    def record_failure(self, err: WevoApiError) -> None:
+        self._probing = False
+        self.failures += 1
+        if isinstance(err, WevoThrottledError):
+            # Rate limiting is explicit; stay away for as long as the host asked.
+            self.open_until = time.monotonic() + (err.retry_after or jittered(BREAKER_RESET_MIN))
+        elif self.failures >= BREAKER_THRESHOLD:
+            self.trips += 1
+            reset = min(BREAKER_RESET_MAX, BREAKER_RESET_MIN * 2 ** (self.trips - 1))
+            self.open_until = time.monotonic() + jittered(reset)
+
+    def release(self) -> None:
+        self._probing = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "trips": self.trips}
+
+
+class WevoCallStats:
+    """Latency histogram and outcome counters for one kind of call."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms: float | None = None
+        self.last_ok: bool | None = None
+
+    @property
+    def success_rate(self) -> float | None:
+        return (self.count - self.errors) / self.count if self.count else None
+
+    def record(self, elapsed_ms: float, ok: bool) -> None:
+        index = 0
+        while index < len(LATENCY_BUCKETS_MS) and elapsed_ms > LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.errors += 0 if ok else 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+        self.last_ok = ok
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record((time.perf_counter() - start) * 1000, ok)
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1) if self.last_ms is not None else None,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class WevoApiStats:
+    """Per-client transport counters exposed through diagnostics."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, WevoCallStats] = {}
+        self.bytes_received = 0
+        self.ws_connects = 0
+        self.ws_reconnects = 0
+        self.ws_unrouted_frames = 0
+
+    def measure(self, operation: str):
+        return self.calls.setdefault(operation, WevoCallStats()).measure()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "bytes_received": self.bytes_received,
+            "ws_connects": self.ws_connects,
+            "ws_reconnects": self.ws_reconnects,
+            "ws_unrouted_frames": self.ws_unrouted_frames,
+            "calls": {name: stats.as_dict() for name, stats in self.calls.items()},
+        }
+
 
 @dataclass
 class WevoTokens:
@@ -20,6 +237,59 @@ class WevoTokens:
     cognito_username: str
 
 
+def _authorize_rejection(frame: dict[str, Any]) -> str | None:
+    status = str(frame.get("status") or frame.get("result") or "").lower()
+    if frame.get("success") is False or frame.get("error") or status in AUTHORIZE_REJECTED_STATUSES:
+        return str(frame.get("error") or frame.get("message") or status or "rejected")
+    return None
+
+
+def transaction_timestamp(tx: dict[str, Any], keys: tuple[str, ...] = TRANSACTION_START_KEYS) -> int | None:
+    for key in keys:
+        value = tx.get(key)
+        if value in (None, ""):
+            continue
+        if isinstance(value, (int, float)):
+            # The API has been seen returning both seconds and milliseconds.
+            return int(value / 1000 if value > 1e12 else value)
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+    return None
+
+
+def _parse_transactions(body: bytes, limit: int | None, since: int | None) -> list[dict[str, Any]]:
+    """Decode a newest-first transaction array one element at a time, stopping once the window is filled."""
+    text = body.decode()
+    end = len(text)
+    idx = len(text) - len(text.lstrip(_JSON_WHITESPACE))
+    if idx >= end or text[idx] != "[":
+        return []
+    idx += 1
+    result: list[dict[str, Any]] = []
+    while limit is None or len(result) < limit:
+        while idx < end and text[idx] in _JSON_WHITESPACE:
+            idx += 1
+        if idx >= end or text[idx] == "]":
+            break
+        tx, idx = _JSON_DECODER.raw_decode(text, idx)
+        if isinstance(tx, dict):
+            started = transaction_timestamp(tx) if since is not None else None
+            # Only a known timestamp can end the window; undated elements are kept.
+            if started is not None and started < since:
+                break
+            result.append(tx)
+        while idx < end and text[idx] in _JSON_WHITESPACE:
+            idx += 1
+        if idx < end and text[idx] == ",":
+            idx += 1
+    return result
+
+
 class WevoApiClient:
     def __init__(
         self,
@@ -33,6 +303,20 @@ class WevoApiClient:
         self._cognito_region = cognito_region
         self._cognito_client_id = cognito_client_id
 
+        self._ws: ClientWebSocketResponse | None = None
+        self._ws_token: str | None = None
+        self._ws_lock = asyncio.Lock()
+        self._ws_reader: asyncio.Task | None = None
+        self._ws_waiters: dict[tuple[str, str, str], list[asyncio.Future]] = {}
+        self._ws_routes: dict[str | None, list[tuple[Callable[[dict[str, Any]], None], bool]]] = {}
+        # First connector each charger was polled with; frames without a connector belong to it.
+        self._first_connectors: dict[str, str] = {}
+        self._ws_failures = 0
+        self._ws_retry_at = 0.0
+        self._conditional_cache: dict[str, tuple[Any, str | None, str | None, Any]] = {}
+        self._breakers: dict[str, WevoCircuitBreaker] = {}
+        self.stats = WevoApiStats()
+
     @property
     def ws_url(self) -> str:
         return self._base_url.replace("https://", "wss://").replace("http://", "ws://") + "/ws"
@@ -43,32 +327,47 @@ class WevoApiClient:
 
     async def login(self, email: str, password: str) -> WevoTokens:
         usernames = [email, f"wevo/{email}"] if not email.startswith("wevo/") else [email]
-        last_error: Exception | None = None
+        # Only one variant exists in the user pool; racing them avoids waiting out the wrong one first.
+        attempts = [asyncio.ensure_future(self._login_as(username, password)) for username in usernames]
+        errors: list[BaseException] = []
+        try:
+            for attempt in asyncio.as_completed(attempts):
+                try:
+                    return await attempt
+                except Exception as err:  # noqa: BLE001
+                    errors.append(err)
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
 
-        for username in usernames:
-            try:
-                payload = {
-                    "AuthFlow": "USER_PASSWORD_AUTH",
-                    "ClientId": self._cognito_client_id,
-                    "AuthParameters": {"USERNAME": username, "PASSWORD": password},
-                }
-                data = await self._cognito_call(payload)
-                auth = data.get("AuthenticationResult", {})
-                access = auth.get("AccessToken")
-                refresh = auth.get("RefreshToken")
-                expires_in = int(auth.get("ExpiresIn", 3600))
-                if not access:
-                    raise WevoApiError("Missing access token in login response")
-                return WevoTokens(
-                    access_token=access,
-                    refresh_token=refresh,
-                    expires_at=int(time.time()) + expires_in,
-                    cognito_username=username,
-                )
-            except Exception as err:  # noqa: BLE001
-                last_error = err
+        auth_errors = [err for err in errors if isinstance(err, WevoAuthError)]
+        if auth_errors:
+            # The other variant typically fails with an unknown-user error.
+            raise WevoAuthError("Invalid Wevo credentials") from auth_errors[0]
+        transient = [err for err in errors if isinstance(err, (*TRANSIENT_ERRORS, WevoCircuitOpenError))]
+        if transient:
+            raise transient[0]
+        raise WevoApiError("Unable to login to Wevo") from errors[-1]
 
-        raise WevoApiError("Unable to login to Wevo") from last_error
+    async def _login_as(self, username: str, password: str) -> WevoTokens:
+        payload = {
+            "AuthFlow": "USER_PASSWORD_AUTH",
+            "ClientId": self._cognito_client_id,
+            "AuthParameters": {"USERNAME": username, "PASSWORD": password},
+        }
+        data = await self._cognito_call(payload)
+        auth = data.get("AuthenticationResult", {})
+        access = auth.get("AccessToken")
+        refresh = auth.get("RefreshToken")
+        expires_in = int(auth.get("ExpiresIn", 3600))
+        if not access:
+            raise WevoApiError("Missing access token in login response")
+        return WevoTokens(
+            access_token=access,
+            refresh_token=refresh,
+            expires_at=int(time.time()) + expires_in,
+            cognito_username=username,
+        )
 
     async def refresh_access_token(self, refresh_token: str, username: str | None = None) -> WevoTokens:
         payload = {
@@ -93,65 +392,382 @@ class WevoApiClient:
     async def get_user_details(self, access_token: str) -> dict[str, Any]:
         return await self._rest_get("/rest/user/details?refreshCognitoData=false", access_token)
 
-    async def get_transactions(self, access_token: str) -> list[dict[str, Any]]:
-        data = await self._rest_get("/rest/transactions", access_token)
-        return data if isinstance(data, list) else []
+    async def get_transactions(
+        self, access_token: str, limit: int | None = None, since: int | None = None
+    ) -> list[dict[str, Any]]:
+        if limit is None and since is None:
+            data = await self._rest_get("/rest/transactions", access_token, conditional=True)
+            return data if isinstance(data, list) else []
+        return await self._rest_get(
+            "/rest/transactions",
+            access_token,
+            conditional=True,
+            parse=lambda body: _parse_transactions(body, limit, since),
+            variant=(limit, since),
+        )
 
     async def get_state(self, access_token: str, charger_identifier: str, connector: str) -> dict[str, Any]:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        async with self._session.ws_connect(self.ws_url, headers=headers, heartbeat=20) as ws:
-            await ws.send_json(
-                {
-                    "command": "getState",
-                    "chargerIdentifier": charger_identifier,
-                    "connector": connector,
-                }
-            )
-
-            for _ in range(5):
-                msg = await ws.receive(timeout=8)
+        states = await self.get_states(access_token, charger_identifier, [connector])
+        return states[str(connector)]
+
+    async def get_states(
+        self, access_token: str, charger_identifier: str, connectors: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        payloads = [
+            {
+                "command": "getState",
+                "chargerIdentifier": charger_identifier,
+                "connector": connector,
+            }
+            for connector in connectors
+        ]
+        if connectors:
+            self._first_connectors[str(charger_identifier)] = str(connectors[0])
+        with self.stats.measure("get_state"):
+            replies = await self._ws_request(access_token, payloads)
+        return {str(connector): reply for connector, reply in zip(connectors, replies)}
+
+    async def authorize(self, access_token: str, charger_identifier: str, connector: str) -> dict[str, Any] | None:
+        """Send authorize and return the acknowledgement or state frame that confirms it.
+
+        Returns None when the charger stays silent until WS_AUTHORIZE_TIMEOUT
+        after the exchange started.
+        """
+        keys = [
+            ("authorize", str(charger_identifier), str(connector)),
+            (_AUTHORIZE_STATE, str(charger_identifier), str(connector)),
+        ]
+        with self.stats.measure("authorize"):
+            futures = [self._add_waiter(keys[0])]
+            deadline = asyncio.get_running_loop().time() + WS_AUTHORIZE_TIMEOUT
+            try:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        ws = await asyncio.shield(self._ensure_ws(access_token))
+                        await self._ws_send_on(
+                            ws,
+                            {
+                                "command": "authorize",
+                                "chargerIdentifier": charger_identifier,
+                                "connector": connector,
+                            },
+                        )
+                except asyncio.TimeoutError as err:
+                    raise WevoConnectionError("Timed out sending authorize to Wevo websocket") from err
+                # State frames from before the command was sent say nothing about its outcome.
+                futures.append(self._add_waiter(keys[1]))
+                done, _ = await asyncio.wait(
+                    futures,
+                    timeout=max(0.0, deadline - asyncio.get_running_loop().time()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for key, future in zip(keys, futures):
+                    self._remove_waiter(key, future)
+
+            if not done:
+                return None
+            frame = done.pop().result()
+            reason = _authorize_rejection(frame)
+            if reason is not None:
+                raise WevoApiError(f"Authorize rejected: {reason}")
+            return frame
+
+    def circuit_states(self) -> dict[str, dict[str, Any]]:
+        return {host: breaker.as_dict() for host, breaker in self._breakers.items()}
+
+    def subscribe(
+        self,
+        charger_identifier: str | None,
+        callback: Callable[[dict[str, Any]], None],
+        unmatched_only: bool = False,
+    ) -> Callable[[], None]:
+        """Route websocket frames for a charger, or frames naming no charger when None, to callback.
+
+        With unmatched_only the callback only receives frames no pending command
+        claimed, such as replies that missed their deadline and unsolicited state changes.
+        """
+        routes = self._ws_routes.setdefault(str(charger_identifier) if charger_identifier is not None else None, [])
+        route = (callback, unmatched_only)
+        routes.append(route)
+
+        def _unsubscribe() -> None:
+            if route in routes:
+                routes.remove(route)
+
+        return _unsubscribe
+
+    async def wait_ws_closed(self) -> None:
+        reader = self._ws_reader
+        if reader is not None:
+            await asyncio.wait({reader})
+
+    async def close(self) -> None:
+        async with self._ws_lock:
+            await self._close_ws()
+        self._fail_ws_waiters(WevoApiError("Wevo client closed"))
+
+    async def _ws_request(self, access_token: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        pending: list[tuple[tuple[str, str, str], asyncio.Future]] = []
+        for payload in payloads:
+            key = (payload["command"], str(payload["chargerIdentifier"]), str(payload["connector"]))
+            pending.append((key, self._add_waiter(key)))
+        try:
+            async with asyncio.timeout(WS_COMMAND_TIMEOUT):
+                # A slow handshake keeps going for the next caller even if this deadline passes.
+                ws = await asyncio.shield(self._ensure_ws(access_token))
+                for payload in payloads:
+                    await self._ws_send_on(ws, payload)
+                return await asyncio.gather(*(future for _, future in pending))
+        except asyncio.TimeoutError as err:
+            raise WevoConnectionError("No state response from Wevo websocket") from err
+        finally:
+            for key, future in pending:
+                self._remove_waiter(key, future)
+
+    def _add_waiter(self, key: tuple[str, str, str]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._ws_waiters.setdefault(key, []).append(future)
+        return future
+
+    def _remove_waiter(self, key: tuple[str, str, str], future: asyncio.Future) -> None:
+        waiters = self._ws_waiters.get(key)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._ws_waiters[key]
+
+    async def _ws_send_on(self, ws: ClientWebSocketResponse, payload: dict[str, Any]) -> None:
+        try:
+            await ws.send_json(payload)
+        except (ClientError, ConnectionResetError) as err:
+            raise WevoConnectionError(f"Websocket send failed: {err}") from err
+
+    async def _ensure_ws(self, access_token: str) -> ClientWebSocketResponse:
+        async with self._ws_lock:
+            if self._ws is not None and not self._ws.closed and self._ws_token == access_token:
+                return self._ws
+
+            # A rotated token means the current connection was authenticated with
+            # stale credentials, so it is replaced rather than reused.
+            await self._close_ws()
+
+            remaining = self._ws_retry_at - time.monotonic()
+            if remaining > 0:
+                raise WevoConnectionError("Websocket reconnect backoff in progress", retry_after=remaining)
+
+            headers = {"Authorization": f"Bearer {access_token}"}
+
+            async def _connect() -> ClientWebSocketResponse:
+                try:
+                    return await asyncio.wait_for(
+                        self._session.ws_connect(self.ws_url, headers=headers, heartbeat=WS_HEARTBEAT),
+                        WS_CONNECT_TIMEOUT,
+                    )
+                except WSServerHandshakeError as err:
+                    raise _http_error(f"Websocket connect failed: {err}", err.status, err.headers) from err
+                except (ClientError, asyncio.TimeoutError) as err:
+                    raise WevoConnectionError(f"Websocket connect failed: {err}") from err
+
+            try:
+                ws = await self._call(self.ws_url, _connect)
+            except WevoTokenRejectedError:
+                # The host is fine; the caller retries straight away with a renewed token.
+                raise
+            except WevoApiError:
+                self._ws_failures += 1
+                backoff = min(WS_BACKOFF_MAX, WS_BACKOFF_MIN * 2 ** (self._ws_failures - 1))
+                self._ws_retry_at = time.monotonic() + jittered(backoff)
+                raise
+
+            if self.stats.ws_connects:
+                self.stats.ws_reconnects += 1
+            self.stats.ws_connects += 1
+            self._ws_failures = 0
+            self._ws_retry_at = 0.0
+            self._ws = ws
+            self._ws_token = access_token
+            self._ws_reader = asyncio.create_task(self._ws_read_loop(ws))
+            return ws
+
+    async def _ws_read_loop(self, ws: ClientWebSocketResponse) -> None:
+        try:
+            async for msg in ws:
                 if msg.type == WSMsgType.TEXT:
-                    data = json.loads(msg.data)
-                    if data.get("chargerIdentifier") == charger_identifier:
-                        return data
+                    self.stats.bytes_received += len(msg.data)
+                    try:
+                        data = json.loads(msg.data)
+                    except ValueError:
+                        continue
+                    if isinstance(data, dict):
+                        self._dispatch_ws_frame(data)
                 elif msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
                     break
+        finally:
+            if self._ws is ws:
+                self._ws = None
+                self._ws_token = None
+                self._fail_ws_waiters(WevoApiError("Wevo websocket closed"))
 
-        raise WevoApiError("No state response from Wevo websocket")
+    def _dispatch_ws_frame(self, data: dict[str, Any]) -> None:
+        charger = data.get("chargerIdentifier")
+        charger = str(charger) if charger is not None else None
+        matched = False
+        if charger is not None:
+            command = data.get("command")
+            connector = data.get("connector")
+            if connector is None:
+                # Same rule as push listeners: the frame is for the charger's first connector only.
+                connector = self._first_connectors.get(charger)
+            if command is None:
+                # State frames do not always echo the command. They answer pending polls first,
+                # and only a frame no poll claimed can confirm an authorize.
+                matched = self._resolve_waiters("getState", charger, connector, data) or self._resolve_waiters(
+                    _AUTHORIZE_STATE, charger, connector, data
+                )
+            else:
+                matched = self._resolve_waiters(command, charger, connector, data)
 
-    async def authorize(self, access_token: str, charger_identifier: str, connector: str) -> None:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        async with self._session.ws_connect(self.ws_url, headers=headers, heartbeat=20) as ws:
-            await ws.send_json(
-                {
-                    "command": "authorize",
-                    "chargerIdentifier": charger_identifier,
-                    "connector": connector,
-                }
-            )
-
-            for _ in range(6):
-                msg = await ws.receive(timeout=1)
-                if msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
-                    break
+        delivered = False
+        for listener, unmatched_only in list(self._ws_routes.get(charger, ())):
+            if unmatched_only and matched:
+                continue
+            listener(data)
+            delivered = True
+        if not matched and not delivered:
+            self.stats.ws_unrouted_frames += 1
+
+    def _resolve_waiters(self, command: str, charger: str, connector: Any, data: dict[str, Any]) -> bool:
+        if connector is None:
+            return False
+        resolved = False
+        for future in self._ws_waiters.pop((command, charger, str(connector)), []):
+            if not future.done():
+                future.set_result(data)
+                resolved = True
+        return resolved
 
-    async def _rest_get(self, path: str, access_token: str) -> Any:
+    def _fail_ws_waiters(self, err: Exception) -> None:
+        waiters, self._ws_waiters = self._ws_waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(err)
+
+    async def _close_ws(self) -> None:
+        ws, self._ws = self._ws, None
+        reader, self._ws_reader = self._ws_reader, None
+        self._ws_token = None
+        if ws is not None and not ws.closed:
+            await ws.close()
+        if reader is not None and not reader.done():
+            reader.cancel()
+
+    async def _rest_get(
+        self,
+        path: str,
+        access_token: str,
+        conditional: bool = False,
+        parse: Callable[[bytes], Any] = json.loads,
+        variant: Any = None,
+    ) -> Any:
         url = f"{self._base_url}{path}"
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with self._session.get(url, headers=headers, timeout=15) as resp:
-            if resp.status >= 400:
-                txt = await resp.text()
-                raise WevoApiError(f"GET {path} failed ({resp.status}): {txt[:200]}")
-            return await resp.json()
+        cached = self._conditional_cache.get(path) if conditional else None
+        if cached is not None and cached[0] != variant:
+            # Validators only apply to the parsed view they were stored with.
+            cached = None
+        if cached is not None:
+            _, etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async def _fetch() -> tuple[int, bytes, str | None, str | None]:
+            with self.stats.measure(f"GET {path.split('?')[0]}"):
+                try:
+                    async with self._session.get(url, headers=headers, timeout=15) as resp:
+                        body = await resp.read()
+                        self.stats.bytes_received += len(body)
+                        if resp.status >= 400:
+                            txt = body.decode(errors="replace")
+                            message = f"GET {path} failed ({resp.status}): {txt[:200]}"
+                            raise _http_error(message, resp.status, resp.headers)
+                        return resp.status, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+                except (ClientError, asyncio.TimeoutError) as err:
+                    raise WevoConnectionError(f"GET {path} failed: {err or 'timed out'}") from err
+
+        status, body, etag, last_modified = await self._call(url, _fetch, REST_RETRIES)
+        if status == 304 and cached is not None:
+            return cached[3]
+        try:
+            if len(body) > JSON_EXECUTOR_THRESHOLD:
+                data = await asyncio.get_running_loop().run_in_executor(None, parse, body)
+            else:
+                data = parse(body)
+        except ValueError as err:
+            raise WevoApiError(f"GET {path} returned invalid JSON") from err
+        if conditional and (etag or last_modified):
+            self._conditional_cache[path] = (variant, etag, last_modified, data)
+        return data
 
     async def _cognito_call(self, payload: dict[str, Any]) -> dict[str, Any]:
         headers = {
             "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
             "Content-Type": "application/x-amz-json-1.1",
         }
-        async with self._session.post(self.cognito_url, headers=headers, json=payload, timeout=20) as resp:
-            data = await resp.json(content_type=None)
-            if resp.status >= 400 or "__type" in data:
-                message = data.get("message") or data.get("Message") or str(data)
-                raise WevoApiError(message)
-            return data
+
+        async def _post() -> dict[str, Any]:
+            with self.stats.measure(f"cognito {payload.get('AuthFlow')}"):
+                try:
+                    request = self._session.post(self.cognito_url, headers=headers, json=payload, timeout=20)
+                    async with request as resp:
+                        body = await resp.read()
+                        self.stats.bytes_received += len(body)
+                        try:
+                            data = json.loads(body)
+                        except ValueError as err:
+                            message = f"Cognito returned invalid JSON ({resp.status})"
+                            raise _http_error(message, max(resp.status, 400)) from err
+                        if resp.status >= 400 or "__type" in data:
+                            message = data.get("message") or data.get("Message") or str(data)
+                            error_type = str(data.get("__type", ""))
+                            if "NotAuthorized" in error_type:
+                                raise WevoAuthError(message)
+                            if "TooManyRequests" in error_type or "LimitExceeded" in error_type:
+                                raise WevoThrottledError(message, _retry_after(resp.headers))
+                            if "InternalError" in error_type:
+                                raise WevoServerError(message)
+                            raise _http_error(message, resp.status, resp.headers)
+                        return data
+                except (ClientError, asyncio.TimeoutError) as err:
+                    raise WevoConnectionError(f"Cognito request failed: {err or 'timed out'}") from err
+
+        return await self._call(self.cognito_url, _post, COGNITO_RETRIES)
+
+    async def _call(self, url: str, request: Callable[[], Awaitable[_T]], retries: int = 0) -> _T:
+        """Run a request through the host's circuit breaker, retrying transient failures with jitter."""
+        host = urlsplit(url).netloc
+        breaker = self._breakers.setdefault(host, WevoCircuitBreaker())
+        attempt = 0
+        while True:
+            breaker.before_call()
+            try:
+                result = await request()
+            except TRANSIENT_ERRORS as err:
+                breaker.record_failure(err)
+                if attempt >= retries or isinstance(err, WevoThrottledError) or breaker.state != "closed":
+                    raise
+            except WevoApiError:
+                # The host answered, it just did not like the request.
+                breaker.record_success()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            attempt += 1
+            await asyncio.sleep(jittered(RETRY_BACKOFF * 2 ** (attempt - 1)))